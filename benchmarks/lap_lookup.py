@@ -0,0 +1,65 @@
+"""
+Lap Lookup Benchmark
+Per-frame cost of lap lookups with 20 cars over a 78-lap race, comparing the
+old linear scan of DriverRaceData.laps with the dense lap-number index.
+
+Run from the repository root:
+    python benchmarks/lap_lookup.py
+"""
+
+import timeit
+
+from synthetic import make_race_data, make_reference_telemetry
+
+from src.core.physics import PhysicsModel
+from src.core.sim_engine import WhatIfSimEngine
+from src.core.weather import WeatherSystem
+
+N_CARS = 20
+N_LAPS = 78
+FRAMES = 2000
+
+
+def linear_scan(driver_data, lap):
+    for lap_data in driver_data.laps:
+        if lap_data.lap_number == lap:
+            return lap_data
+    return None
+
+
+def main():
+    race_data = make_race_data(N_CARS, N_LAPS)
+    drivers = list(race_data.values())
+    
+    # Worst case for the scan: every car on the last lap
+    def frame(lookup):
+        for driver_data in drivers:
+            lookup(driver_data, N_LAPS)
+    
+    scan = min(timeit.repeat(lambda: frame(linear_scan), number=FRAMES, repeat=5)) / FRAMES
+    indexed = min(timeit.repeat(lambda: frame(lambda d, lap: d.get_lap(lap)), number=FRAMES, repeat=5)) / FRAMES
+    
+    engine = WhatIfSimEngine(
+        race_data=race_data,
+        reference_telemetry=make_reference_telemetry(),
+        physics=PhysicsModel(),
+        weather=WeatherSystem(),
+        player_driver='D00',
+        total_laps=N_LAPS
+    )
+    engine.jump_to_lap(N_LAPS - 1)
+    update = min(timeit.repeat(lambda: engine.update(1 / 60), number=200, repeat=5)) / 200
+    
+    engine.jump_to_lap(N_LAPS - 1)
+    engine._get_lap_data = linear_scan
+    update_scan = min(timeit.repeat(lambda: engine.update(1 / 60), number=200, repeat=5)) / 200
+    
+    print(f"{N_CARS} cars, lap {N_LAPS} of {N_LAPS}")
+    print(f"  lookups per frame, linear scan : {scan * 1e6:8.1f} us")
+    print(f"  lookups per frame, lap index   : {indexed * 1e6:8.1f} us  ({scan / indexed:.0f}x)")
+    print(f"  engine.update, linear scan     : {update_scan * 1e6:8.1f} us")
+    print(f"  engine.update, lap index       : {update * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
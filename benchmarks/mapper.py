@@ -0,0 +1,45 @@
+"""
+Coordinate Mapper Benchmark
+Cost of placing every car on screen one point at a time versus one batched
+transform, and of the fit_to_screen cache check done every frame.
+
+Run from the repository root:
+    python benchmarks/mapper.py
+"""
+
+import timeit
+
+import numpy as np
+
+from synthetic import make_reference_telemetry
+
+from src.data.mapper import CoordinateMapper
+
+N_CARS = 20
+
+
+def main():
+    track_coords = make_reference_telemetry(5000)[['X', 'Y']].to_numpy()
+    mapper = CoordinateMapper(1280, 720, padding=80)
+    mapper.fit_to_screen(track_coords)
+    
+    rng = np.random.default_rng(0)
+    xs = rng.uniform(-4000, 4000, N_CARS)
+    ys = rng.uniform(-2000, 2000, N_CARS)
+    
+    one_by_one = lambda: [mapper.geo_to_pixel(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+    batched = lambda: mapper.geo_to_pixel_many(xs, ys).tolist()
+    assert [list(p) for p in one_by_one()] == batched()
+    
+    print(f"{N_CARS} cars, {len(track_coords)} track points")
+    for name, call in (("geo_to_pixel per car", one_by_one), ("geo_to_pixel_many", batched)):
+        cost = min(timeit.repeat(call, number=2000, repeat=5)) / 2000
+        print(f"  {name:<22}: {cost * 1e6:6.1f} us")
+    cached = min(timeit.repeat(lambda: mapper.fit_to_screen(track_coords), number=2000, repeat=5)) / 2000
+    print(f"  fit_to_screen (cached): {cached * 1e6:6.2f} us")
+    resize = min(timeit.repeat(lambda: mapper.resize(*((1920, 1080) if mapper.screen_width == 1280 else (1280, 720))), number=200, repeat=5)) / 200
+    print(f"  resize (re-fit)       : {resize * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
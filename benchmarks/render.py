@@ -0,0 +1,118 @@
+"""
+Render Benchmark
+Per-frame CPU cost of drawing the race view at 1280x720 and 3840x2160,
+repainting the whole window every frame versus layered dirty-rect updates,
+a check that both give the same picture, and how many surfaces the glyph
+and sprite caches still create per frame. Uses the SDL dummy video driver.
+
+Run from the repository root:
+    python benchmarks/render.py
+"""
+
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from synthetic import make_race_data, make_reference_telemetry
+
+from src.core.physics import PhysicsModel
+from src.core.sim_engine import WhatIfSimEngine
+from src.core.weather import WeatherSystem
+from src.data.mapper import CoordinateMapper
+from src.ui.renderer import GameRenderer
+
+N_CARS = 20
+N_LAPS = 60
+FRAMES = 300
+SIZES = ((1280, 720), (3840, 2160))
+
+
+def make_view(size):
+    screen = pygame.display.set_mode(size)
+    reference = make_reference_telemetry()
+    track_coords = reference[['X', 'Y']].to_numpy()
+    mapper = CoordinateMapper(*size, padding=80)
+    mapper.fit_to_screen(track_coords)
+    engine = WhatIfSimEngine(
+        race_data=make_race_data(N_CARS, N_LAPS),
+        reference_telemetry=reference,
+        physics=PhysicsModel(),
+        weather=WeatherSystem(),
+        player_driver='D00',
+        total_laps=N_LAPS
+    )
+    return GameRenderer(screen, mapper), engine, track_coords
+
+
+def draw(renderer: GameRenderer, engine: WhatIfSimEngine, track_coords):
+    """The draw calls of one frame of main.py."""
+    renderer.draw_track(track_coords)
+    renderer.draw_all_cars(engine.cars, engine.player_driver)
+    renderer.draw_timeline(engine.get_race_progress(), engine.player_state.current_lap, N_LAPS)
+    renderer.draw_lap_controls(engine.player_state.current_lap, N_LAPS)
+    renderer.draw_time_scale(engine.time_scale, engine.reverse)
+    renderer.draw_dashboard(
+        engine.player_state, N_LAPS, 0.0, engine.get_player_position(), len(engine.cars),
+        engine.get_historical_comparison()
+    )
+    renderer.draw_leaderboard(engine.get_sorted_cars(), engine.player_driver)
+    renderer.draw_controls(engine.player_state.mode, engine.player_state.pit_requested)
+
+
+def run(size, layered: bool):
+    """
+    Average milliseconds per frame (simulation excluded) and surfaces created
+    per frame after the first second.
+    """
+    renderer, engine, track_coords = make_view(size)
+    total = 0.0
+    for frame in range(FRAMES):
+        if frame == 60:
+            warm = renderer.glyphs.misses + renderer.sprites.misses
+        engine.update(1 / 60)
+        start = time.perf_counter()
+        draw(renderer, engine, track_coords)
+        if layered:
+            pygame.display.update(renderer.compose())
+        else:
+            renderer.layers.invalidate()
+            renderer.compose()
+            pygame.display.flip()
+        total += time.perf_counter() - start
+    created = renderer.glyphs.misses + renderer.sprites.misses - warm
+    return total / FRAMES * 1000, created / (FRAMES - 60)
+
+
+def same_picture(size) -> bool:
+    """Layered frames end up identical to a full repaint of the same frame."""
+    renderer, engine, track_coords = make_view(size)
+    for _ in range(FRAMES):
+        engine.update(1 / 60)
+        draw(renderer, engine, track_coords)
+        renderer.compose()
+    layered = renderer.screen.copy()
+    draw(renderer, engine, track_coords)
+    renderer.layers.invalidate()
+    renderer.compose()
+    return pygame.image.tobytes(layered, 'RGB') == pygame.image.tobytes(renderer.screen, 'RGB')
+
+
+def main():
+    pygame.init()
+    print(f"{N_CARS} cars, {FRAMES} frames at 1x")
+    for size in SIZES:
+        full, _ = run(size, layered=False)
+        layered, created = run(size, layered=True)
+        print(
+            f"  {size[0]}x{size[1]}: full repaint {full:6.2f} ms, layered {layered:6.2f} ms "
+            f"({full / layered:.1f}x), same picture: {same_picture(size)}, "
+            f"surfaces created per frame: {created:.2f}"
+        )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Event Core Benchmark
+Per-frame cost of WhatIfSimEngine.update with 20 cars at several playback
+speeds, a check that the race does not depend on frame time or speed, the
+latency and exactness of seeking back to any race time, and a check that a
+headless run started mid-race matches a run from the start.
+
+Run from the repository root:
+    python benchmarks/sim_events.py
+"""
+
+import timeit
+
+from synthetic import make_race_data, make_reference_telemetry
+
+from src.core.physics import PhysicsModel
+from src.core.sim_engine import WhatIfSimEngine
+from src.core.weather import WeatherSystem
+
+N_CARS = 20
+N_LAPS = 60
+RACE_SECONDS = 3000.0
+MID_RACE_LAP = 30
+
+
+def make_engine(race_data):
+    return WhatIfSimEngine(
+        race_data=race_data,
+        reference_telemetry=make_reference_telemetry(),
+        physics=PhysicsModel(),
+        weather=WeatherSystem(),
+        player_driver='D00',
+        total_laps=N_LAPS
+    )
+
+
+def run(race_data, dt: float, time_scale: int = 1) -> WhatIfSimEngine:
+    engine = make_engine(race_data)
+    engine.set_time_scale(time_scale)
+    for _ in range(round(RACE_SECONDS / (dt * time_scale))):
+        engine.update(dt)
+    return engine
+
+
+def main():
+    race_data = make_race_data(N_CARS, N_LAPS)
+    
+    print(f"{N_CARS} cars, {N_LAPS} laps")
+    for scale in (1, 10, 100):
+        engine = make_engine(race_data)
+        engine.set_time_scale(scale)
+        update = min(timeit.repeat(lambda: engine.update(1 / 60), number=200, repeat=5)) / 200
+        print(f"  engine.update at 60 fps, {scale:>3}x : {update * 1e6:8.1f} us")
+    
+    reference = run(race_data, 1 / 60)
+    for dt, scale in ((1 / 30, 1), (1 / 60, 50), (0.5, 100)):
+        other = run(race_data, dt, scale)
+        drift = max(
+            abs(reference.cumulative_times[code] - other.cumulative_times[code])
+            for code in reference.cars
+        )
+        player = other.player_state
+        same = (
+            player.current_lap == reference.player_state.current_lap
+            and player.lap_progress == reference.player_state.lap_progress
+            and player.tire_wear == reference.player_state.tire_wear
+        )
+        print(f"  dt={dt:.3f}s at {scale:>3}x vs 1x: time drift {drift:.2e} s, player state identical: {same}")
+    
+    # Seek back to race times seen during forward play
+    engine = make_engine(race_data)
+    engine.set_time_scale(10)
+    engine.request_pit('HARD')
+    seen = []
+    for frame in range(round(RACE_SECONDS / 10 * 60)):
+        engine.update(1 / 60)
+        if frame % 97 == 0:
+            seen.append((engine.race_time, car_states(engine)))
+    exact = 0
+    for race_time, states in seen:
+        engine.seek(race_time)
+        exact += car_states(engine) == states
+    seek = min(timeit.repeat(lambda: engine.seek(RACE_SECONDS * 0.37), number=100, repeat=5)) / 100
+    print(f"  seek (mid-lap, backwards)     : {seek * 1e6:8.1f} us, exact at {exact}/{len(seen)} race times")
+    
+    # Headless from lap 30, with the player where the run from the start had them
+    pit_plan = {40: 'HARD'}
+    full = make_engine(race_data).run_to_completion(pit_plan=pit_plan)
+    engine = make_engine(race_data)
+    engine.jump_to_lap(MID_RACE_LAP)
+    before = full.player_laps[MID_RACE_LAP - 2]
+    player = engine.player_state
+    player.compound, player.tire_age, player.tire_wear = before.compound, before.tire_age, before.tire_wear
+    engine.cumulative_times[engine.player_driver] = before.cumulative_time
+    mid_race = engine.run_to_completion(pit_plan=pit_plan)
+    same = (
+        mid_race.player_laps == full.player_laps[MID_RACE_LAP - 1:]
+        and mid_race.final_positions == full.final_positions
+    )
+    print(f"  headless from lap {MID_RACE_LAP} vs lap 1   : same laps and positions: {same}")
+
+
+def car_states(engine: WhatIfSimEngine):
+    return [
+        (c.current_lap, c.lap_progress, c.tire_wear, c.compound, c.in_pit, engine.cumulative_times[code])
+        for code, c in sorted(engine.cars.items())
+    ]
+
+
+if __name__ == "__main__":
+    main()
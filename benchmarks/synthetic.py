@@ -0,0 +1,59 @@
+"""
+Synthetic Race Data
+Deterministic fake sessions for benchmarks, no FastF1 download needed.
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.data.loader import DriverRaceData
+from src.data.race_store import RaceStore
+
+
+def make_laps(n_drivers: int = 20, n_laps: int = 78, seed: int = 0) -> pd.DataFrame:
+    """A FastF1-shaped laps table: one stop per driver, one lap gap for the last car."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for d in range(n_drivers):
+        pit_lap = n_laps // 3 + d % 10
+        for lap in range(1, n_laps + 1):
+            if d == n_drivers - 1 and lap == n_laps // 2:
+                continue
+            stint_one = lap <= pit_lap
+            rows.append({
+                'Driver': f"D{d:02d}",
+                'LapNumber': float(lap),
+                'LapTime': pd.Timedelta(seconds=75.0 + d * 0.1 + rng.normal(0, 0.3)),
+                'Compound': 'MEDIUM' if stint_one else 'HARD',
+                'TyreLife': float(lap if stint_one else lap - pit_lap),
+                'PitInTime': pd.Timedelta(seconds=1) if lap == pit_lap else pd.NaT,
+                'PitOutTime': pd.Timedelta(seconds=1) if lap == pit_lap + 1 else pd.NaT,
+                'Position': float(d + 1),
+            })
+    return pd.DataFrame(rows)
+
+
+def make_race_data(n_drivers: int = 20, n_laps: int = 78, seed: int = 0) -> Dict[str, DriverRaceData]:
+    codes = [f"D{d:02d}" for d in range(n_drivers)]
+    store = RaceStore.from_laps(make_laps(n_drivers, n_laps, seed), codes)
+    return {
+        code: DriverRaceData(code, f"Driver {code}", 'Team', (200, 200, 200), store, store.driver_index(code))
+        for code in codes
+    }
+
+
+def make_reference_telemetry(n_samples: int = 800) -> pd.DataFrame:
+    """An elliptical lap sampled every 100 ms."""
+    t = np.linspace(0.0, 2 * np.pi, n_samples, endpoint=False)
+    return pd.DataFrame({
+        'Time_ms': np.arange(n_samples) * 100.0,
+        'X': 4000.0 * np.cos(t),
+        'Y': 2000.0 * np.sin(t),
+        'Speed': 220.0 + 60.0 * np.sin(3 * t),
+    })
@@ -3,21 +3,41 @@ F1 Strategy Engineer - What-If Race Simulator
 Replays REAL race data while letting you modify one driver's strategy.
 """
 
+import os
 import sys
+import time
+from pathlib import Path
+
 import pygame
 from src.data.loader import F1DataLoader
+from src.data.load_job import LoadJob, LoadCancelled
 from src.data.mapper import CoordinateMapper
 from src.core.sim_engine import WhatIfSimEngine
 from src.core.physics import PhysicsModel
 from src.core.weather import WeatherSystem
 from src.ui.menu import MenuScreen
 from src.ui.renderer import GameRenderer
+from src.ui.profiler import FrameProfiler
 
 # Screen configuration
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 WINDOW_FLAGS = pygame.RESIZABLE
 
+# Draw each ghost along its own recorded lap instead of the reference lap.
+# Builds a telemetry archive for the race on first use (slow, one time).
+GHOST_TELEMETRY = False
+
+# Longest wall-clock frame fed to the engine (avoids a burst of catch-up
+# simulation after a stall, e.g. while the window is being dragged)
+MAX_FRAME_TIME = 0.25
+
+# Race seconds skipped by the left/right arrow keys
+SEEK_SECONDS = 10.0
+
+# Frame traces dumped with F4 go here
+PROFILE_DIR = "profiles"
+
 def main():
     # 1. Init Pygame
     pygame.init()
@@ -29,37 +49,71 @@ def main():
     loader = F1DataLoader()
     menu = MenuScreen(screen, loader)
     
-    try:
-        year, gp, player_driver = menu.run()
-    except SystemExit:
-        return
-        
-    # 3. Loading Phase
+    # 3. Loading Phase (background thread, ESC cancels back to the menu)
     loading_font = pygame.font.SysFont("Arial", 28)
+    hint_font = pygame.font.SysFont("Arial", 18)
     
-    def show_loading(message: str):
+    def show_loading(message: str, current: int = 0, total: int = 0, hint: str = ""):
+        width, height = screen.get_size()
         screen.fill((20, 20, 20))
         text = loading_font.render(message, True, (255, 255, 255))
-        screen.blit(text, text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+        screen.blit(text, text.get_rect(center=(width // 2, height // 2)))
+        
+        if total > 0:
+            bar = pygame.Rect(0, 0, width // 2, 12)
+            bar.center = (width // 2, height // 2 + 40)
+            pygame.draw.rect(screen, (60, 60, 60), bar)
+            pygame.draw.rect(screen, (225, 6, 0), (bar.x, bar.y, bar.width * current // total, bar.height))
+        
+        if hint:
+            hint_surf = hint_font.render(hint, True, (150, 150, 150))
+            screen.blit(hint_surf, hint_surf.get_rect(center=(width // 2, height - 40)))
         pygame.display.flip()
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-    
-    show_loading(f"Loading {year} {gp}...")
-    
-    # Load session
-    session = loader.load_session(year, gp, 'R')
-    track_coords = loader.get_track_coordinates(session)
     
-    # Load FULL race data for all drivers
-    show_loading("Loading race data for all drivers...")
+    def wait_for_load(job: LoadJob):
+        """Keep the window responsive until the job finishes. None if cancelled or failed."""
+        while not job.done():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    job.cancel()
+                    pygame.quit()
+                    sys.exit()
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    job.cancel()
+                    print("Loading cancelled")
+                    return None
+            
+            stage, current, total = job.progress()
+            if total > 0:
+                stage = f"{stage} ({current}/{total})"
+            show_loading(stage, current, total, hint="ESC - Back to menu")
+            clock.tick(30)
+        
+        try:
+            return job.result()
+        except LoadCancelled:
+            return None
+        except Exception as e:
+            print(f"Loading failed: {e}")
+            show_loading(f"Loading failed: {e}")
+            pygame.time.wait(3000)
+            return None
     
-    def progress_callback(driver, current, total):
-        show_loading(f"Loading: {driver} ({current}/{total})")
+    loaded = None
+    while loaded is None:
+        try:
+            year, gp, player_driver = menu.run()
+        except SystemExit:
+            return
+        
+        # Processed race data, track layout and weather (snapshot cache or FastF1)
+        loaded = wait_for_load(
+            loader.load_race_async(year, gp, player_driver, telemetry_archive=GHOST_TELEMETRY)
+        )
     
-    race_data = loader.load_full_race_data(session, progress_callback=progress_callback)
+    race, telemetry_archive = loaded
+    race_data = race.race_data
+    track_coords = race.track_coords
     
     if player_driver not in race_data:
         if race_data:
@@ -71,9 +125,8 @@ def main():
             pygame.quit()
             return
     
-    # Get reference telemetry for track rendering
-    show_loading("Loading track layout...")
-    reference_telemetry = loader.get_reference_lap_telemetry(session, player_driver)
+    # Reference telemetry for track rendering
+    reference_telemetry = race.reference_telemetry[player_driver]
     
     # Get total laps
     total_laps = max(d.total_laps for d in race_data.values())
@@ -83,7 +136,7 @@ def main():
     
     mapper = CoordinateMapper(SCREEN_WIDTH, SCREEN_HEIGHT, padding=80)
     weather = WeatherSystem()
-    weather.load_from_session(session)
+    weather.load_from_table(race.historical_rain)
     
     physics = PhysicsModel()
     
@@ -93,7 +146,9 @@ def main():
         physics=physics,
         weather=weather,
         player_driver=player_driver,
-        total_laps=total_laps
+        total_laps=total_laps,
+        telemetry_archive=telemetry_archive,
+        ghost_telemetry=GHOST_TELEMETRY
     )
     
     renderer = GameRenderer(screen, mapper)
@@ -101,6 +156,12 @@ def main():
     # Pre-compute track pixels
     mapper.fit_to_screen(track_coords)
     
+    # Frame profiler (F3, or F1_PROFILE=1): times the update, every draw call
+    # and the display update
+    profiler = FrameProfiler.from_env()
+    profiler.instrument(engine, ['update'])
+    profiler.instrument(renderer, [name for name in dir(GameRenderer) if name.startswith('draw_')] + ['compose'])
+    
     # 5. Game Loop
     running = True
     fps = 60
@@ -115,11 +176,15 @@ def main():
     print("\nControls:")
     print("  SPACE - Pause/Resume")
     print("  ESC   - Quit")
-    print("  Click timeline to jump")
+    print("  + / - - Playback speed (1x-100x), 0 resets to 1x")
+    print("  BACKSPACE - Reverse playback, LEFT / RIGHT - Seek 10s")
+    print("  Click timeline to seek")
+    print("  F3 - Frame profiler, F4 - Dump frame trace")
     print("  Modify strategy and see what happens!\n")
     
     while running:
-        dt = clock.tick(fps) / 1000.0
+        dt = min(clock.tick(fps) / 1000.0, MAX_FRAME_TIME)
+        profiler.begin_frame()
         
         # Event Handling
         for event in pygame.event.get():
@@ -134,21 +199,42 @@ def main():
                 elif event.key == pygame.K_r:
                     weather.toggle_sandbox()
                     weather.set_sandbox_rain(0.8 if weather.sandbox_mode else 0.0)
+                elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                    engine.faster()
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    engine.slower()
+                elif event.key in (pygame.K_0, pygame.K_KP0):
+                    engine.set_time_scale(1)
+                elif event.key == pygame.K_BACKSPACE:
+                    engine.toggle_reverse()
+                elif event.key == pygame.K_LEFT:
+                    engine.seek(engine.race_time - SEEK_SECONDS)
+                elif event.key == pygame.K_RIGHT:
+                    engine.seek(engine.race_time + SEEK_SECONDS)
+                elif event.key == pygame.K_F3:
+                    if not profiler.toggle():
+                        renderer.layers.invalidate()  # Clear the overlay
+                elif event.key == pygame.K_F4:
+                    path = profiler.dump(Path(PROFILE_DIR) / time.strftime("frames-%Y%m%d-%H%M%S.csv"))
+                    print(f"Frame trace written to {path}")
             
             if not engine.paused:
                 renderer.handle_input(event, engine)
             
             if event.type == pygame.VIDEORESIZE:
-                screen = pygame.display.set_mode((event.w, event.h), WINDOW_FLAGS)
-                mapper = CoordinateMapper(event.w, event.h, padding=80)
-                renderer = GameRenderer(screen, mapper)
-                renderer.track_surface = None
+                renderer.request_resize(event.size)
+        
+        # Re-layout once the window has stopped changing size
+        size = renderer.resize_due()
+        if size:
+            screen = pygame.display.set_mode(size, WINDOW_FLAGS)
+            renderer.resize(screen)
+        profiler.mark('events')
         
         # Update simulation
         engine.update(dt)
         
-        # Render
-        screen.fill(renderer.COLOR_BG)
+        # Render: draw calls queue layers and items, compose() repaints what changed
         
         # Draw track
         renderer.draw_track(track_coords)
@@ -160,6 +246,7 @@ def main():
         race_progress = engine.get_race_progress()
         renderer.draw_timeline(race_progress, engine.player_state.current_lap, total_laps)
         renderer.draw_lap_controls(engine.player_state.current_lap, total_laps)
+        renderer.draw_time_scale(engine.time_scale, engine.reverse)
         
         # Draw dashboard with comparison
         rain_level = weather.get_current_weather(engine.race_time)
@@ -187,16 +274,26 @@ def main():
         
         # Weather indicator
         if weather.sandbox_mode:
-            font = pygame.font.SysFont("Arial", 20)
-            txt = font.render(f"SANDBOX WEATHER: {weather.sandbox_intensity:.0%}", True, (0, 255, 255))
-            screen.blit(txt, (20, 50))
+            renderer.draw_sandbox_weather(weather.sandbox_intensity)
         
         # Pause overlay
         if engine.paused:
             renderer.draw_pause_overlay()
         
-        pygame.display.flip()
+        rects = renderer.compose()
+        if profiler.enabled:
+            rects.append(profiler.draw(screen, renderer.font_tiny))
+            profiler.mark('overlay')
         
+        pygame.display.update(rects)
+        profiler.mark('display')
+        profiler.end_frame()
+    
+    trace_path = os.environ.get(FrameProfiler.TRACE_ENV_VAR)
+    if trace_path:
+        path = profiler.dump(Path(trace_path))
+        print(f"Frame trace written to {path}")
+    
     # Show final comparison
     final_comparison = engine.get_historical_comparison()
     print(f"\n{'='*50}")
@@ -1,7 +1,10 @@
 # Core layer - Simulation logic and physics
-from .sim_engine import WhatIfSimEngine, CarState
+from .sim_engine import WhatIfSimEngine, CarState, RaceResult, PlayerLapRecord
 from .physics import PhysicsModel
 from .weather import WeatherSystem
 from .oracle import StrategyOracle
+from .strategy import StrategySweep, StrategyPlan
+from .batch import ScenarioRunner, Scenario, ScenarioResult
 
-__all__ = ['WhatIfSimEngine', 'CarState', 'PhysicsModel', 'WeatherSystem', 'StrategyOracle']
+__all__ = ['WhatIfSimEngine', 'CarState', 'RaceResult', 'PlayerLapRecord', 'PhysicsModel', 'WeatherSystem', 'StrategyOracle',
+           'StrategySweep', 'StrategyPlan', 'ScenarioRunner', 'Scenario', 'ScenarioResult']
@@ -0,0 +1,138 @@
+"""
+Batch Scenario Runner
+Fans independent headless What-If scenarios out over a process pool.
+Race data is handed to each worker process once, through the pool
+initializer, and results stream back as they finish.
+"""
+
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+from .physics import PhysicsModel
+from .sim_engine import RaceResult, WhatIfSimEngine
+from .weather import WeatherSystem
+from ..data.loader import DriverRaceData
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One headless what-if run."""
+    player_driver: str
+    pit_plan: Tuple[Tuple[int, str], ...] = ()  # (pit at end of lap, new compound)
+    mode: str = "NORMAL"
+    sandbox_rain: Optional[float] = None  # None = historical weather
+    name: str = ""
+
+
+@dataclass
+class ScenarioResult:
+    """A finished scenario and its race outcome."""
+    scenario: Scenario
+    result: RaceResult
+
+
+# Race data of the pool a worker process belongs to. Only ever set by
+# _init_worker inside pool processes, never in the calling process.
+_WORKER_DATA: Optional[Tuple[Dict[str, DriverRaceData], Dict[int, float], int]] = None
+
+
+def _init_worker(race_data: Dict[str, DriverRaceData], historical_rain: Dict[int, float], total_laps: int):
+    global _WORKER_DATA
+    _WORKER_DATA = (race_data, historical_rain, total_laps)
+
+
+def _run_in_worker(scenario: Scenario) -> ScenarioResult:
+    return _run_scenario(scenario, *_WORKER_DATA)
+
+
+def _run_scenario(
+    scenario: Scenario,
+    race_data: Dict[str, DriverRaceData],
+    historical_rain: Dict[int, float],
+    total_laps: int
+) -> ScenarioResult:
+    weather = WeatherSystem()
+    weather.historical_rain = historical_rain
+    if scenario.sandbox_rain is not None:
+        weather.set_sandbox_rain(scenario.sandbox_rain)
+    
+    engine = WhatIfSimEngine(
+        race_data=race_data,
+        reference_telemetry=None,
+        physics=PhysicsModel(),
+        weather=weather,
+        player_driver=scenario.player_driver,
+        total_laps=total_laps
+    )
+    engine.set_mode(scenario.mode)
+    result = engine.run_to_completion(pit_plan=dict(scenario.pit_plan))
+    return ScenarioResult(scenario=scenario, result=result)
+
+
+class ScenarioRunner:
+    """
+    Runs many scenarios in parallel across CPU cores.
+    
+    Usage:
+        runner = ScenarioRunner(race_data, weather, total_laps)
+        for done in runner.run(scenarios, progress_callback=cb):
+            ...
+    """
+    
+    def __init__(
+        self,
+        race_data: Dict[str, DriverRaceData],
+        weather: WeatherSystem,
+        total_laps: int,
+        max_workers: Optional[int] = None
+    ):
+        self.race_data = race_data
+        self.historical_rain = weather.historical_rain
+        self.total_laps = total_laps
+        self.max_workers = max_workers or os.cpu_count() or 1
+    
+    def run(
+        self,
+        scenarios: Sequence[Scenario],
+        progress_callback: Optional[Callable[[Scenario, int, int], None]] = None
+    ) -> Iterator[ScenarioResult]:
+        """
+        Execute scenarios and yield results in completion order.
+        
+        Args:
+            scenarios: Scenarios to run
+            progress_callback: Called as (scenario, completed, total) after each one
+        """
+        total = len(scenarios)
+        shared = (self.race_data, self.historical_rain, self.total_laps)
+        
+        if self.max_workers == 1 or total <= 1:
+            for i, scenario in enumerate(scenarios):
+                done = _run_scenario(scenario, *shared)
+                if progress_callback:
+                    progress_callback(scenario, i + 1, total)
+                yield done
+            return
+        
+        # Never fork: loader and prefetch threads may be running in this
+        # process. Race data is pickled once per worker at startup, never per task.
+        method = 'forkserver' if 'forkserver' in mp.get_all_start_methods() else 'spawn'
+        executor = ProcessPoolExecutor(
+            self.max_workers,
+            mp_context=mp.get_context(method),
+            initializer=_init_worker,
+            initargs=shared
+        )
+        try:
+            futures = [executor.submit(_run_in_worker, scenario) for scenario in scenarios]
+            for i, future in enumerate(as_completed(futures)):
+                done = future.result()
+                if progress_callback:
+                    progress_callback(done.scenario, i + 1, total)
+                yield done
+        finally:
+            # Also reached when the caller stops iterating early
+            executor.shutdown(cancel_futures=True)
@@ -4,6 +4,7 @@ Calculates tire degradation, lap time penalties, and physical interactions.
 """
 
 from typing import Dict
+import numpy as np
 
 class PhysicsModel:
     """
@@ -29,6 +30,15 @@ class PhysicsModel:
         'WET': 4.5            # On dry track
     }
     
+    # Compounds missing from the tables above (e.g. 'UNKNOWN' stints)
+    DEFAULT_WEAR_RATE = 0.025
+    DEFAULT_PACE_DELTA = 0.5
+    
+    # Index order used by the array variants below (compound codes); any
+    # other compound gets UNKNOWN_CODE and the default wear and pace
+    COMPOUND_ORDER = ('SOFT', 'MEDIUM', 'HARD', 'INTERMEDIATE', 'WET')
+    UNKNOWN_CODE = len(COMPOUND_ORDER)
+    
     # Push modes affect both pace and wear
     MODE_MULTIPLIERS = {
         'PUSH': {'wear': 1.6, 'pace': 1.05},    # 5% faster, 60% more wear
@@ -48,7 +58,7 @@ class PhysicsModel:
         Returns:
             New wear increment to add
         """
-        base = self.TIRE_WEAR_RATES.get(compound.upper(), 0.025)
+        base = self.TIRE_WEAR_RATES.get(compound.upper(), self.DEFAULT_WEAR_RATE)
         mult = self.MODE_MULTIPLIERS.get(mode, self.MODE_MULTIPLIERS['NORMAL'])['wear']
         
         # Wear accelerates as tire gets older (cliff effect)
@@ -79,7 +89,7 @@ class PhysicsModel:
             
         # 2. Compound Delta
         # Normalize base delta to percentage (approx 1.5s lap = ~1.5%)
-        compound_delta = self.COMPOUND_PACE_DELTA.get(compound.upper(), 0.5) * 0.012
+        compound_delta = self.COMPOUND_PACE_DELTA.get(compound.upper(), self.DEFAULT_PACE_DELTA) * 0.012
         
         # 3. Weather Penalty (The crucial cross-over logic)
         weather_penalty = 0.0
@@ -105,3 +115,49 @@ class PhysicsModel:
         total_perf = mode_pace - wear_penalty - compound_delta - weather_penalty
         
         return max(0.1, total_perf) # Minimum speed 10%
+    
+    # === Vectorized variants ===
+    # Same formulas as above, evaluated element-wise on arrays of compound
+    # codes (indices into COMPOUND_ORDER) so many strategies can be priced at once.
+    
+    def compound_code(self, compound: str) -> int:
+        """Index of a compound in COMPOUND_ORDER, UNKNOWN_CODE if it is not there."""
+        compound = compound.upper()
+        if compound not in self.COMPOUND_ORDER:
+            return self.UNKNOWN_CODE
+        return self.COMPOUND_ORDER.index(compound)
+    
+    def calculate_tire_wear_array(self, compounds: np.ndarray, current_wear: np.ndarray, mode: str) -> np.ndarray:
+        """Array version of calculate_tire_wear."""
+        rates = np.array([self.TIRE_WEAR_RATES[c] for c in self.COMPOUND_ORDER] + [self.DEFAULT_WEAR_RATE])
+        mult = self.MODE_MULTIPLIERS.get(mode, self.MODE_MULTIPLIERS['NORMAL'])['wear']
+        cliff_factor = 1.0 + (current_wear * 1.5)
+        return rates[compounds] * mult * cliff_factor
+    
+    def calculate_pace_factor_array(
+        self,
+        compounds: np.ndarray,
+        wear: np.ndarray,
+        mode: str,
+        rain_intensity: np.ndarray
+    ) -> np.ndarray:
+        """Array version of calculate_pace_factor."""
+        wear_penalty = np.where(wear < 0.6, wear * 0.1, 0.06 + ((wear - 0.6) * 0.5))
+        
+        deltas = np.array([self.COMPOUND_PACE_DELTA[c] for c in self.COMPOUND_ORDER] + [self.DEFAULT_PACE_DELTA])
+        compound_delta = deltas[compounds] * 0.012
+        
+        is_wet = compounds == self.compound_code('WET')
+        is_rain_tire = is_wet | (compounds == self.compound_code('INTERMEDIATE'))
+        rain = np.broadcast_to(rain_intensity, np.shape(compounds))
+        weather_penalty = np.select(
+            [rain < 0.1, rain < 0.6],
+            [np.where(is_rain_tire, 0.05 + (rain * 0.1), 0.0),
+             np.where(is_wet, 0.05, 0.0)],
+            default=np.where(is_wet, 0.0, rain * 1.2)
+        )
+        
+        mode_pace = self.MODE_MULTIPLIERS.get(mode, self.MODE_MULTIPLIERS['NORMAL'])['pace']
+        total_perf = mode_pace - wear_penalty - compound_delta - weather_penalty
+        
+        return np.maximum(0.1, total_perf)
@@ -4,13 +4,18 @@ Replays the REAL race while allowing player to modify one driver's strategy.
 Ghost cars follow historical data exactly. Player car responds to decisions.
 """
 
+import bisect
+import heapq
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import pandas as pd
 import numpy as np
 from .physics import PhysicsModel
+from .timing import TimingLoops
+from .track import FieldSampler, TrackSampler
 from .weather import WeatherSystem
 from ..data.loader import DriverRaceData, LapData
+from ..data.telemetry_archive import TelemetryArchive
 
 
 @dataclass
@@ -28,6 +33,8 @@ class CarState:
     # Position & timing
     position: int = 1
     gap_to_leader: float = 0.0  # Seconds behind P1
+    interval: float = 0.0  # Seconds behind the car ahead
+    laps_down: int = 0  # Laps behind P1 (gaps are then lap totals)
     last_lap_time: float = 90.0  # Seconds
     
     # Tire state
@@ -54,33 +61,153 @@ class CarState:
     track_y: float = 0.0
 
 
+@dataclass
+class PlayerLapRecord:
+    """Player state at the end of one lap of a headless run."""
+    lap_number: int
+    lap_time: float
+    cumulative_time: float
+    position: int
+    compound: str
+    tire_age: int
+    tire_wear: float
+    mode: str
+    pitted: bool
+
+
+@dataclass
+class RaceResult:
+    """Outcome of a headless what-if run."""
+    player_driver: str
+    final_positions: Dict[str, int]
+    cumulative_times: Dict[str, float]
+    laps_completed: Dict[str, int]
+    player_laps: List[PlayerLapRecord]
+    
+    @property
+    def player_position(self) -> int:
+        return self.final_positions[self.player_driver]
+    
+    @property
+    def player_time(self) -> float:
+        return self.cumulative_times[self.player_driver]
+
+
+@dataclass
+class EngineState:
+    """
+    Compact copy of the whole engine state.
+    Per-car fields are arrays indexed by engine slot; compounds are indices
+    into the engine's compound table.
+    """
+    player_lap: int
+    race_time: float
+    mode: str
+    
+    current_lap: np.ndarray
+    lap_progress: np.ndarray
+    position: np.ndarray
+    last_lap_time: np.ndarray
+    compound: np.ndarray
+    next_compound: np.ndarray
+    tire_age: np.ndarray
+    tire_wear: np.ndarray
+    pit_timer: np.ndarray
+    flags: np.ndarray          # in_pit, pit_requested, finished, dnf
+    cumulative_time: np.ndarray
+    order: np.ndarray          # Slots in standings order
+    
+    lap_start: np.ndarray
+    lap_duration: np.ndarray
+    timing_times: np.ndarray
+    timing_loops: np.ndarray
+    timing_last: np.ndarray
+
+
+@dataclass
+class PlayerKeyframe:
+    """Player state at one race time (ghosts never need one, see seek)."""
+    race_time: float
+    values: tuple              # CarState fields in PLAYER_FIELDS order
+    cumulative_time: float
+    timing_times: np.ndarray   # Player's row of the timing loops
+    timing_loops: np.ndarray
+    timing_last: int
+
+
 class WhatIfSimEngine:
     """
     What-If Race Simulator.
     
     - Ghost cars: Follow EXACT historical lap times/positions
     - Player car: Starts with real data, but strategy changes affect outcome
+    
+    The engine is driven either frame by frame through update(dt) or, headless,
+    lap by lap through run_to_completion(). reference_telemetry is only needed
+    for rendering and may be None when running headless.
+    
+    Ghost cars are event driven: a heap holds the race time of each ghost's
+    next lap completion, and a ghost's state only changes when its event
+    fires. Lap progress in between is interpolated from the lap start time,
+    so results do not depend on the frame time step. Ghosts always run on
+    the historical race clock, so their state at any race time can also be
+    looked up directly from the race store's cumulative time tables.
+    
+    The full state is captured as an EngineState every time the player starts
+    a lap, so jump_to_lap restores the what-if race exactly, and branch()
+    starts an independent what-if from any captured lap.
+    
+    seek() moves to any race time, mid-lap and backwards included: ghosts
+    are looked up in the race store, the player is restored from a keyframe
+    (recorded every KEYFRAME_STEPS steps) and simulated the few steps left.
+    Reverse playback is a seek every frame.
     """
     
     PIT_STOP_DURATION = 22.0  # Average pit stop time in seconds
     
+    # Race time is always simulated in steps of this size, whatever the frame
+    # rate or playback speed, so any speed gives the same race
+    SIM_STEP = 1.0 / 60.0
+    TIME_SCALES = (1, 2, 5, 10, 20, 50, 100)
+    
+    # A player keyframe every second of race time bounds a seek to 60 steps
+    # of the player alone
+    KEYFRAME_STEPS = 60
+    SEEK_AHEAD = 10.0  # Seconds a seek may simulate past the recorded what-if
+    PLAYER_FIELDS = (
+        'current_lap', 'lap_progress', 'position', 'last_lap_time', 'compound', 'next_compound',
+        'tire_age', 'tire_wear', 'pit_timer', 'in_pit', 'pit_requested', 'finished', 'dnf', 'mode'
+    )
+    
     def __init__(
         self,
         race_data: Dict[str, DriverRaceData],
-        reference_telemetry: pd.DataFrame,
+        reference_telemetry: Optional[pd.DataFrame],
         physics: PhysicsModel,
         weather: WeatherSystem,
         player_driver: str,
-        total_laps: int
+        total_laps: int,
+        telemetry_archive: Optional[TelemetryArchive] = None,
+        ghost_telemetry: bool = False
     ):
         self.race_data = race_data
+        self.telemetry_archive = telemetry_archive
         self.reference_telemetry = reference_telemetry
-        self.track_length = len(reference_telemetry)
         self.physics = physics
         self.weather = weather
         self.player_driver = player_driver
         self.total_laps = total_laps
         
+        # Track position sampling (one vectorized call per frame for all cars).
+        # With ghost_telemetry each ghost follows its own recorded lap line.
+        self.track: Optional[TrackSampler] = None
+        self.field_sampler: Optional[FieldSampler] = None
+        if reference_telemetry is not None:
+            self.track = TrackSampler.from_telemetry(reference_telemetry)
+            self.field_sampler = FieldSampler(self.track, len(race_data))
+        self.ghost_telemetry = ghost_telemetry and telemetry_archive is not None
+        self._line_laps: Dict[str, int] = {}
+        
         # Initialize car states
         self.cars: Dict[str, CarState] = {}
         self._init_cars()
@@ -88,15 +215,70 @@ class WhatIfSimEngine:
         # Race state
         self.current_lap = 1
         self.race_time = 0.0  # Total elapsed race time in seconds
-        self.lap_start_time = 0.0  # Time when current lap started
         self.paused = False
         
+        # Playback speed: race seconds simulated per wall-clock second
+        self.time_scale = 1
+        self._time_bank = 0.0  # Race time owed to the simulation, < SIM_STEP
+        self.reverse = False   # Play backwards (seek every frame)
+        
         # Player reference
         self.player_state = self.cars[player_driver]
         
         # Track timing for position calculation
         self.cumulative_times: Dict[str, float] = {code: 0.0 for code in race_data.keys()}
         
+        # Cars in race order, kept up to date incrementally and shared with
+        # the leaderboard (get_sorted_cars) and race progress
+        self.standings: List[CarState] = list(self.cars.values())
+        self._reset_standings()
+        
+        # Ghost event queue: (race time of next lap completion, slot).
+        # Slot i is the i-th car of self.cars; each ghost's current lap runs
+        # from _lap_start[i] for _lap_duration[i] seconds.
+        self._codes: List[str] = list(self.cars)
+        self._ghost_slots = np.array(
+            [i for i, code in enumerate(self._codes) if code != player_driver], dtype=np.intp
+        )
+        self._ghosts: List[CarState] = [self.cars[self._codes[i]] for i in self._ghost_slots]
+        self._ghost_set = set(self._ghost_slots.tolist())
+        self._slots: Dict[str, int] = {code: i for i, code in enumerate(self._codes)}
+        
+        # Ghost state at any race time comes from the shared race store
+        self._store = next(iter(race_data.values())).store
+        self._rows = np.array([race_data[code].index for code in self._codes], dtype=np.intp)
+        self._lap_start = np.zeros(len(self._codes))
+        self._lap_duration = np.full(len(self._codes), np.inf)
+        self._lap_number = np.ones(len(self._codes), dtype=np.int64)
+        self._events: List[Tuple[float, int]] = []
+        self._rebuild_events(0.0)
+        finite = np.isfinite(self._store.lap_end_time)
+        self._race_end = float(self._store.lap_end_time[finite].max())
+        # Race clock for the timeline: the car that really completed the most laps first
+        laps_run = self._store.laps_run[self._rows]
+        ends = self._store.lap_end_time[self._rows, laps_run]
+        leaders = np.flatnonzero(laps_run == laps_run.max())
+        self._clock_row = int(self._rows[leaders[np.argmin(ends[leaders])]])
+        
+        # Mini-sector timing loops for live gaps; slots that crossed a loop
+        # since gaps were last updated
+        self.timing = TimingLoops(len(self._codes))
+        self._crossed: set = set()
+        self._reset_timing()
+        self._sync_track_positions()
+        
+        # Engine state at the start of each player lap
+        self._compounds: List[str] = []
+        self._compound_index: Dict[str, int] = {}
+        self.lap_snapshots: Dict[int, EngineState] = {}
+        self._capture_lap()
+        
+        # Player keyframes in race time order, for seek()
+        self._key_times: List[float] = []
+        self._keyframes: List[PlayerKeyframe] = []
+        self._key_steps = 0  # Steps simulated since the last keyframe
+        self._record_keyframe()
+    
     def _init_cars(self):
         """Initialize car states from race data."""
         for driver_code, driver_data in self.race_data.items():
@@ -120,206 +302,664 @@ class WhatIfSimEngine:
                 compound=starting_compound,
                 is_player=is_player
             )
-            
-            # Sync initial position
-            self._sync_track_position(self.cars[driver_code])
     
     def toggle_pause(self):
         self.paused = not self.paused
         return self.paused
     
+    def set_time_scale(self, scale: float) -> float:
+        """Set playback speed (clamped to the TIME_SCALES range)."""
+        self.time_scale = max(self.TIME_SCALES[0], min(scale, self.TIME_SCALES[-1]))
+        return self.time_scale
+    
+    def faster(self) -> float:
+        """Next playback speed up."""
+        higher = [s for s in self.TIME_SCALES if s > self.time_scale]
+        return self.set_time_scale(higher[0] if higher else self.TIME_SCALES[-1])
+    
+    def slower(self) -> float:
+        """Next playback speed down."""
+        lower = [s for s in self.TIME_SCALES if s < self.time_scale]
+        return self.set_time_scale(lower[-1] if lower else self.TIME_SCALES[0])
+    
+    def toggle_reverse(self) -> bool:
+        """Switch between forward and reverse playback."""
+        self.reverse = not self.reverse
+        return self.reverse
+    
     def update(self, dt: float):
-        """Advance simulation by dt seconds."""
+        """
+        Advance simulation by dt seconds of wall-clock time.
+        
+        dt * time_scale seconds of race time are simulated in fixed SIM_STEP
+        steps; the remainder carries over to the next frame. The race state
+        after n steps is the same at any playback speed or frame rate.
+        In reverse the same number of steps is sought backwards.
+        """
         if self.paused:
             return
         
-        self.race_time += dt
+        self._time_bank += dt * self.time_scale
+        steps = int(self._time_bank / self.SIM_STEP)
+        if steps <= 0:
+            return
+        self._time_bank -= steps * self.SIM_STEP
         
-        # Update each car
-        for driver_code, car in self.cars.items():
-            if car.finished or car.dnf:
-                continue
-                
-            if car.is_player:
-                self._update_player(car, dt)
+        if self.reverse:
+            if self.race_time <= 0.0:
+                self.reverse = False
             else:
-                self._update_ghost(car, dt)
+                self._seek(self.race_time - steps * self.SIM_STEP)
+            return
         
-        # Recalculate positions based on cumulative time
-        self._recalculate_positions()
+        changed = False
+        for _ in range(steps):
+            changed = self._step(self.SIM_STEP) or changed
+        
+        self._update_lap_progress()
+        
+        # Standings only change when a lap is completed; gaps whenever a
+        # car crosses a timing loop
+        if changed:
+            self._recalculate_positions()
+        elif self._crossed:
+            self._update_gaps([self.cars[self._codes[slot]] for slot in self._crossed])
+        self._crossed.clear()
         
         # Update track positions for rendering
-        for car in self.cars.values():
-            self._sync_track_position(car)
+        self._sync_track_positions()
     
-    def _update_ghost(self, car: CarState, dt: float):
-        """
-        Update ghost car to follow REAL historical data.
-        Uses actual lap times from the race.
-        """
-        driver_data = self.race_data[car.driver_code]
+    def _step(self, dt: float) -> bool:
+        """Simulate dt seconds of race time. Returns True if any car completed a lap."""
+        step_start = self.race_time
+        self.race_time += dt
         
-        # Get current lap info
-        current_lap_data = self._get_lap_data(driver_data, car.current_lap)
-        if not current_lap_data:
-            car.finished = True
-            return
+        # Ghosts: only cars whose lap ends within this step are touched
+        changed = self._process_events(self.race_time)
         
-        # Calculate progress through lap based on real lap time
-        real_lap_time = current_lap_data.lap_time_seconds
+        car = self.player_state
+        if not (car.finished or car.dnf):
+            if self._update_player(car, step_start, dt):
+                self._capture_lap()
+                changed = True
         
-        # Advance progress
-        progress_per_second = 1.0 / real_lap_time
-        car.lap_progress += progress_per_second * dt
+        self._key_steps += 1
+        if self._key_steps >= self.KEYFRAME_STEPS:
+            self._record_keyframe()
+        return changed
+    
+    def _rebuild_events(self, lap_start: float):
+        """Requeue every running ghost, its current lap starting at `lap_start`."""
+        self._events = []
+        self._lap_duration[:] = np.inf
+        for slot in self._ghost_slots.tolist():
+            self._schedule_ghost(slot, lap_start)
+    
+    def _schedule_ghost(self, slot: int, lap_start: float):
+        """Queue the end of a ghost's current lap, which started at race time `lap_start`."""
+        car = self.cars[self._codes[slot]]
+        self._lap_start[slot] = lap_start
+        self._lap_duration[slot] = np.inf
+        self._lap_number[slot] = car.current_lap
+        if car.finished or car.dnf:
+            return
         
-        # Check if lap completed
-        if car.lap_progress >= 1.0:
-            car.lap_progress -= 1.0
-            car.current_lap += 1
-            car.last_lap_time = real_lap_time
-            
-            # Update tire state from historical data
-            next_lap_data = self._get_lap_data(driver_data, car.current_lap)
-            if next_lap_data:
-                # Check for pit stop
-                if current_lap_data.is_pit_in:
-                    car.compound = next_lap_data.compound
-                    car.tire_age = 0
-                else:
-                    car.tire_age = next_lap_data.tire_life
-                
-                car.position = next_lap_data.position
-            
-            # Update cumulative time
-            self.cumulative_times[car.driver_code] += real_lap_time
-            
-            if car.current_lap > self.total_laps:
-                car.finished = True
+        lap_data = self._get_lap_data(self.race_data[car.driver_code], car.current_lap)
+        if not lap_data:
+            car.finished = True
+            return
+        
+        self._lap_duration[slot] = lap_data.lap_time_seconds
+        heapq.heappush(self._events, (lap_start + lap_data.lap_time_seconds, slot))
     
-    def _update_player(self, car: CarState, dt: float):
+    def _process_events(self, until: float) -> bool:
         """
-        Update player car with physics simulation.
-        Base lap time comes from historical data, modified by player decisions.
+        Fire every ghost lap completion up to race time `until`, in time order.
+        Returns True if any event fired.
         """
-        driver_data = self.race_data[car.driver_code]
-        
-        # Handle pit stop
-        if car.in_pit:
-            car.pit_timer += dt
-            if car.pit_timer >= self.PIT_STOP_DURATION:
-                car.in_pit = False
-                car.pit_timer = 0.0
-                car.compound = car.next_compound
-                car.tire_age = 0
-                car.tire_wear = 0.0
+        fired = False
+        while self._events and self._events[0][0] <= until:
+            lap_end, slot = heapq.heappop(self._events)
+            car = self.cars[self._codes[slot]]
+            driver_data = self.race_data[car.driver_code]
+            lap_data = self._get_lap_data(driver_data, car.current_lap)
+            self.timing.cross_lap(slot, car.current_lap, self._lap_start[slot], self._lap_duration[slot], 1.0)
+            self._crossed.add(slot)
+            self._complete_ghost_lap(car, driver_data, lap_data)
+            self._schedule_ghost(slot, lap_end)
+            fired = True
+        return fired
+    
+    def _update_lap_progress(self):
+        """
+        Interpolate every ghost's lap progress at the current race time and
+        record the timing loops passed since the last update.
+        """
+        if not self._ghosts:
             return
+        slots = self._ghost_slots
+        progress = np.clip((self.race_time - self._lap_start[slots]) / self._lap_duration[slots], 0.0, 1.0)
+        for car, p in zip(self._ghosts, progress.tolist()):
+            car.lap_progress = p
         
-        # Get base lap time from historical data
-        current_lap_data = self._get_lap_data(driver_data, car.current_lap)
-        if not current_lap_data:
-            car.finished = True
-            return
+        # Ghosts move at a constant rate through each lap, so crossing times are exact
+        timing = self.timing
+        loops = (self._lap_number[slots] - 1) * timing.n_sectors + (progress * timing.n_sectors).astype(np.int64)
+        for k in np.flatnonzero(loops > timing.last[slots]).tolist():
+            slot = int(slots[k])
+            if np.isfinite(self._lap_duration[slot]):
+                timing.cross_lap(slot, int(self._lap_number[slot]), self._lap_start[slot],
+                                 self._lap_duration[slot], float(progress[k]))
+                self._crossed.add(slot)
+    
+    def _complete_ghost_lap(self, car: CarState, driver_data: DriverRaceData, lap_data: LapData):
+        """Apply the historical end-of-lap state of a ghost car."""
+        real_lap_time = lap_data.lap_time_seconds
+        car.current_lap += 1
+        car.last_lap_time = real_lap_time
         
-        base_lap_time = current_lap_data.lap_time_seconds
+        # Update tire state from historical data
+        next_lap_data = self._get_lap_data(driver_data, car.current_lap)
+        if next_lap_data:
+            # Check for pit stop
+            if lap_data.is_pit_in:
+                car.compound = next_lap_data.compound
+                car.tire_age = 0
+            else:
+                car.tire_age = next_lap_data.tire_life
+            
+            car.position = next_lap_data.position
         
-        # Apply physics modifiers based on player decisions
-        rain_level = self.weather.get_current_weather(self.race_time)
-        pace_factor = self.physics.calculate_pace_factor(
-            car.compound,
-            car.tire_wear,
-            car.mode,
-            rain_level
-        )
+        # Update cumulative time
+        self.cumulative_times[car.driver_code] += real_lap_time
         
-        # Modified lap time (faster pace = lower time)
-        # pace_factor > 1.0 means faster, so divide
-        modified_lap_time = base_lap_time / pace_factor
+        if car.current_lap > self.total_laps:
+            car.finished = True
+    
+    def _update_player(self, car: CarState, step_start: float, dt: float) -> bool:
+        """
+        Update player car with physics simulation.
+        Base lap time comes from historical data, modified by player decisions.
         
-        # Advance progress
-        progress_per_second = 1.0 / modified_lap_time
-        car.lap_progress += progress_per_second * dt
+        The step is split at lap and pit-exit boundaries, so the time left
+        over after an event carries into the next lap or out of the pits.
+        Returns True if the player completed a lap.
+        """
+        driver_data = self.race_data[car.driver_code]
+        completed = False
+        elapsed = 0.0
         
-        # Accumulate tire wear
-        if car.lap_progress > 0:
+        while elapsed < dt and not car.finished:
+            remaining = dt - elapsed
+            
+            # Handle pit stop
+            if car.in_pit:
+                step = min(remaining, self.PIT_STOP_DURATION - car.pit_timer)
+                car.pit_timer += step
+                elapsed += step
+                if car.pit_timer >= self.PIT_STOP_DURATION:
+                    self._finish_pit_stop(car)
+                continue
+            
+            # Get base lap time from historical data
+            current_lap_data = self._get_lap_data(driver_data, car.current_lap)
+            if not current_lap_data:
+                car.finished = True
+                break
+            
+            base_lap_time = current_lap_data.lap_time_seconds
+            
+            # Apply physics modifiers based on player decisions
+            rain_level = self.weather.get_current_weather(step_start + elapsed)
+            pace_factor = self.physics.calculate_pace_factor(
+                car.compound,
+                car.tire_wear,
+                car.mode,
+                rain_level
+            )
+            
+            # Modified lap time (faster pace = lower time)
+            # pace_factor > 1.0 means faster, so divide
+            modified_lap_time = base_lap_time / pace_factor
+            
+            # Advance progress, at most to the end of the lap
+            time_to_line = (1.0 - car.lap_progress) * modified_lap_time
+            step = min(remaining, time_to_line)
+            
+            # Timing loops passed during this step (constant pace within it)
+            slot = self._slots[car.driver_code]
+            lap_start = step_start + elapsed - car.lap_progress * modified_lap_time
+            car.lap_progress += step / modified_lap_time
+            elapsed += step
+            reached = 1.0 if step >= time_to_line else car.lap_progress
+            if self.timing.cross_lap(slot, car.current_lap, lap_start, modified_lap_time, reached):
+                self._crossed.add(slot)
+            
+            # Accumulate tire wear
             wear_rate = self.physics.calculate_tire_wear(
                 car.compound,
                 car.tire_wear,
                 car.mode
             )
-            car.tire_wear += wear_rate * dt / modified_lap_time
+            car.tire_wear += wear_rate * step / modified_lap_time
             car.tire_wear = min(0.99, car.tire_wear)
-        
-        # Check if lap completed
-        if car.lap_progress >= 1.0:
-            car.lap_progress -= 1.0
-            car.current_lap += 1
-            car.last_lap_time = modified_lap_time
-            car.tire_age += 1
-            
-            # Update cumulative time
-            self.cumulative_times[car.driver_code] += modified_lap_time
-            
-            # Check pit request
-            if car.pit_requested:
-                car.in_pit = True
-                car.pit_requested = False
-                self.cumulative_times[car.driver_code] += self.PIT_STOP_DURATION
             
-            if car.current_lap > self.total_laps:
-                car.finished = True
+            # Check if lap completed
+            if step >= time_to_line:
+                car.lap_progress = 0.0
+                self._complete_player_lap(car, modified_lap_time)
+                completed = True
+        
+        return completed
+    
+    def _complete_player_lap(self, car: CarState, lap_time: float):
+        """Close out a player lap: timing, tire age and a pending pit request."""
+        car.current_lap += 1
+        car.last_lap_time = lap_time
+        car.tire_age += 1
+        
+        # Update cumulative time
+        self.cumulative_times[car.driver_code] += lap_time
+        
+        # Check pit request
+        if car.pit_requested:
+            car.in_pit = True
+            car.pit_requested = False
+            self.cumulative_times[car.driver_code] += self.PIT_STOP_DURATION
+        
+        if car.current_lap > self.total_laps:
+            car.finished = True
+    
+    def _finish_pit_stop(self, car: CarState):
+        """Release the car from the pit lane on fresh tires."""
+        car.in_pit = False
+        car.pit_timer = 0.0
+        car.compound = car.next_compound
+        car.tire_age = 0
+        car.tire_wear = 0.0
     
     def _get_lap_data(self, driver_data: DriverRaceData, lap: int) -> Optional[LapData]:
         """Get lap data for a specific lap number."""
-        for lap_data in driver_data.laps:
-            if lap_data.lap_number == lap:
-                return lap_data
-        return None
+        return driver_data.get_lap(lap)
+    
+    def get_lap_telemetry(self, driver_code: str, lap: int) -> Optional[np.ndarray]:
+        """
+        Real telemetry samples of a driver's lap (zero-copy archive view).
+        None when no telemetry archive is attached or the lap is missing.
+        """
+        if self.telemetry_archive is None or not self.telemetry_archive.has_lap(driver_code, lap):
+            return None
+        return self.telemetry_archive.get_lap(driver_code, lap)
     
     def _recalculate_positions(self):
-        """Recalculate race positions based on cumulative time + current lap progress."""
-        # Build list of (driver, total_distance_equivalent)
-        standings = []
-        for code, car in self.cars.items():
+        """
+        Recalculate race positions based on cumulative time + current lap progress.
+        
+        Cars only swap with near neighbours between updates, so the previous
+        standings are re-ranked with one insertion-sort pass (close to O(n))
+        instead of a full sort.
+        """
+        order = self.standings
+        
+        # Rank key: distance (desc), then cumulative time (asc)
+        keys = []
+        for car in order:
             if car.dnf:
                 distance = -1  # DNF goes to back
             else:
                 # Distance = completed laps + current progress
                 distance = (car.current_lap - 1) + car.lap_progress
-            
-            # For ties, use cumulative time (lower is better)
-            standings.append((code, distance, self.cumulative_times[code]))
+            keys.append((-distance, self.cumulative_times[car.driver_code]))
         
-        # Sort by distance (desc), then by time (asc)
-        standings.sort(key=lambda x: (-x[1], x[2]))
+        for i in range(1, len(order)):
+            car, key = order[i], keys[i]
+            j = i - 1
+            while j >= 0 and keys[j] > key:
+                order[j + 1], keys[j + 1] = order[j], keys[j]
+                j -= 1
+            order[j + 1], keys[j + 1] = car, key
         
         # Assign positions
-        leader_time = standings[0][2] if standings else 0
-        for i, (code, distance, time) in enumerate(standings):
-            self.cars[code].position = i + 1
-            self.cars[code].gap_to_leader = time - leader_time
+        for i, car in enumerate(order):
+            car.position = i + 1
+        self._update_gaps(order)
+    
+    def _update_gaps(self, cars: List[CarState]):
+        """
+        Gap to the leader and interval to the car ahead, measured at the last
+        timing loop each car crossed. Falls back to lap totals (cumulative
+        times) when the car ahead has no record of that loop.
+        """
+        order = self.standings
+        leader = order[0]
+        leader_slot = self._slots[leader.driver_code]
+        for car in cars:
+            i = car.position - 1
+            if i <= 0:
+                car.gap_to_leader = car.interval = 0.0
+                car.laps_down = 0
+                continue
+            
+            slot = self._slots[car.driver_code]
+            ahead = order[i - 1]
+            gap = self.timing.gap(slot, leader_slot)
+            interval = self.timing.gap(slot, self._slots[ahead.driver_code])
+            
+            car.laps_down = self.timing.laps_behind(slot, leader_slot)
+            if gap is None:
+                gap = self.cumulative_times[car.driver_code] - self.cumulative_times[leader.driver_code]
+            if interval is None:
+                interval = self.cumulative_times[car.driver_code] - self.cumulative_times[ahead.driver_code]
+            car.gap_to_leader = gap
+            car.interval = interval
+    
+    def _reset_timing(self, player: bool = True):
+        """
+        Restart timing. Ghost loop crossings of the previous and current lap
+        are rebuilt exactly from history; the player crosses its current loop
+        now, or keeps its own timing row with player=False.
+        """
+        self.timing.reset(None if player else self._ghost_slots)
+        for slot, car in zip(self._ghost_slots.tolist(), self._ghosts):
+            self._time_history(slot, car, self._lap_start[slot], self._lap_duration[slot])
+        
+        if player:
+            car = self.player_state
+            self.timing.cross(self._slots[car.driver_code], self.timing.loop_at(car.current_lap, car.lap_progress), self.race_time)
+        self._crossed.clear()
+    
+    def _time_history(self, slot: int, car: CarState, lap_start: float, lap_duration: float):
+        """Loop crossings of a car on its historical clock, previous lap included."""
+        store = self._store
+        row, lap = self._rows[slot], car.current_lap
+        if 1 < lap <= store.laps_run[row] + 1:
+            previous = float(store.lap_time[row, lap - 1])
+            self.timing.cross_lap(slot, lap - 1, lap_start - previous, previous, 1.0)
+        if np.isfinite(lap_duration):
+            self.timing.cross_lap(slot, lap, lap_start, lap_duration, car.lap_progress)
     
-    def _sync_track_position(self, car: CarState):
-        """Update car's X,Y position on track for rendering."""
-        # Map lap_progress to telemetry index
-        idx = int(car.lap_progress * (self.track_length - 1))
-        idx = max(0, min(idx, self.track_length - 1))
+    def _reset_standings(self):
+        """Rebuild the standings from each car's position (after a jump)."""
+        self.standings.sort(key=lambda c: c.position)
+    
+    def _sync_track_positions(self):
+        """Update every car's X,Y position on track for rendering."""
+        if self.field_sampler is None:
+            return
         
-        row = self.reference_telemetry.iloc[idx]
-        car.track_x = row['X']
-        car.track_y = row['Y']
+        cars = list(self.cars.values())
+        if self.ghost_telemetry:
+            for slot, car in enumerate(cars):
+                if not car.is_player and self._line_laps.get(car.driver_code) != car.current_lap:
+                    self._line_laps[car.driver_code] = car.current_lap
+                    self.field_sampler.set_line(slot, self._ghost_line(car))
+        
+        progress = np.fromiter((car.lap_progress for car in cars), dtype=np.float64, count=len(cars))
+        xs, ys = self.field_sampler.sample(progress)
+        for car, x, y in zip(cars, xs.tolist(), ys.tolist()):
+            car.track_x = x
+            car.track_y = y
+    
+    def _ghost_line(self, car: CarState) -> Optional[TrackSampler]:
+        """A ghost's own recorded line for its current lap (None = reference line)."""
+        samples = self.get_lap_telemetry(car.driver_code, car.current_lap)
+        if samples is None or len(samples) < 2:
+            return None
+        return TrackSampler.from_telemetry(samples)
+    
+    # === Headless Mode ===
+    
+    def run_to_completion(
+        self,
+        pit_plan: Optional[Dict[int, str]] = None,
+        mode_plan: Optional[Dict[int, str]] = None
+    ) -> RaceResult:
+        """
+        Run the rest of the race headless, one lap at a time.
+        
+        Instead of integrating fixed dt steps, every car jumps from one lap
+        completion to the next. Ghost laps are taken straight from history;
+        the player's lap time and tire wear are evaluated once per lap with
+        the physics model. Cars do not interact, so the player's position at
+        each lap end is resolved from the ghosts' historical lap end times.
+        
+        Args:
+            pit_plan: Lap number -> compound. The player pits at the end of that lap.
+            mode_plan: Lap number -> driving mode, applied from that lap onwards.
+            
+        Returns:
+            RaceResult with final positions, cumulative times and per-lap player state
+        """
+        pit_plan = pit_plan or {}
+        mode_plan = mode_plan or {}
+        self._drop_future()
+        
+        player_laps: List[PlayerLapRecord] = []
+        
+        for code, car in self.cars.items():
+            if car.is_player:
+                continue
+            driver_data = self.race_data[code]
+            while not (car.finished or car.dnf):
+                lap_data = self._get_lap_data(driver_data, car.current_lap)
+                if not lap_data:
+                    car.finished = True
+                    break
+                self._complete_ghost_lap(car, driver_data, lap_data)
+            car.lap_progress = 0.0
+        
+        car = self.player_state
+        driver_data = self.race_data[car.driver_code]
+        if car.in_pit:
+            self._finish_pit_stop(car)
+        
+        while not (car.finished or car.dnf):
+            lap = car.current_lap
+            lap_data = self._get_lap_data(driver_data, lap)
+            if not lap_data:
+                car.finished = True
+                break
+            
+            if lap in mode_plan:
+                self.set_mode(mode_plan[lap])
+            if lap in pit_plan:
+                self.request_pit(pit_plan[lap])
+            
+            rain_level = self.weather.get_current_weather(self.cumulative_times[car.driver_code])
+            pace_factor = self.physics.calculate_pace_factor(
+                car.compound,
+                car.tire_wear,
+                car.mode,
+                rain_level
+            )
+            lap_time = lap_data.lap_time_seconds / pace_factor
+            
+            # Only the part of the lap still ahead of the car wears the tires
+            wear_rate = self.physics.calculate_tire_wear(car.compound, car.tire_wear, car.mode)
+            car.tire_wear = min(0.99, car.tire_wear + wear_rate * (1.0 - car.lap_progress))
+            car.lap_progress = 0.0
+            
+            compound, mode = car.compound, car.mode
+            pitted = car.pit_requested
+            self._complete_player_lap(car, lap_time)
+            if car.in_pit:
+                self._finish_pit_stop(car)
+            
+            cumulative = self.cumulative_times[car.driver_code]
+            player_laps.append(PlayerLapRecord(
+                lap_number=lap,
+                lap_time=lap_time,
+                cumulative_time=cumulative,
+                position=self._position_at_lap_end(lap, cumulative),
+                compound=compound,
+                tire_age=car.tire_age,
+                tire_wear=car.tire_wear,
+                mode=mode,
+                pitted=pitted
+            ))
+        
+        self.race_time = max(self.cumulative_times.values(), default=0.0)
+        self._rebuild_events(self.race_time)
+        self.timing.reset()
+        self._recalculate_positions()
+        
+        return RaceResult(
+            player_driver=self.player_driver,
+            final_positions={code: c.position for code, c in self.cars.items()},
+            cumulative_times=dict(self.cumulative_times),
+            laps_completed={code: c.current_lap - 1 for code, c in self.cars.items()},
+            player_laps=player_laps
+        )
+    
+    def _position_at_lap_end(self, lap: int, race_time: float) -> int:
+        """Player position when completing `lap` at `race_time`."""
+        lap_end_time = self._store.lap_end_time
+        if lap >= lap_end_time.shape[1]:
+            return 1
+        # A ghost is ahead if it had really completed this lap by then; the
+        # table is keyed by lap number, so it does not matter where the run started
+        ends = lap_end_time[self._rows[self._ghost_slots], lap]
+        return int(np.count_nonzero(ends < race_time)) + 1
+    
+    # === State Snapshots ===
+    
+    def _compound_code(self, compound: str) -> int:
+        code = self._compound_index.get(compound)
+        if code is None:
+            code = self._compound_index[compound] = len(self._compounds)
+            self._compounds.append(compound)
+        return code
+    
+    def snapshot(self) -> EngineState:
+        """Capture the current state in O(cars)."""
+        cars = [self.cars[code] for code in self._codes]
+        flags = np.array([(c.in_pit, c.pit_requested, c.finished, c.dnf) for c in cars], dtype=bool)
+        return EngineState(
+            player_lap=self.player_state.current_lap,
+            race_time=self.race_time,
+            mode=self.player_state.mode,
+            current_lap=np.array([c.current_lap for c in cars], dtype=np.int32),
+            lap_progress=np.array([c.lap_progress for c in cars]),
+            position=np.array([c.position for c in cars], dtype=np.int32),
+            last_lap_time=np.array([c.last_lap_time for c in cars]),
+            compound=np.array([self._compound_code(c.compound) for c in cars], dtype=np.int16),
+            next_compound=np.array([self._compound_code(c.next_compound) for c in cars], dtype=np.int16),
+            tire_age=np.array([c.tire_age for c in cars], dtype=np.int32),
+            tire_wear=np.array([c.tire_wear for c in cars]),
+            pit_timer=np.array([c.pit_timer for c in cars]),
+            flags=flags,
+            cumulative_time=np.array([self.cumulative_times[code] for code in self._codes]),
+            order=np.array([self._slots[c.driver_code] for c in self.standings], dtype=np.int32),
+            lap_start=self._lap_start.copy(),
+            lap_duration=self._lap_duration.copy(),
+            timing_times=self.timing.times.copy(),
+            timing_loops=self.timing.loops.copy(),
+            timing_last=self.timing.last.copy()
+        )
+    
+    def restore(self, state: EngineState):
+        """Put the engine back into a captured state in O(cars)."""
+        columns = zip(
+            state.current_lap.tolist(), state.lap_progress.tolist(), state.position.tolist(),
+            state.last_lap_time.tolist(), state.compound.tolist(), state.next_compound.tolist(),
+            state.tire_age.tolist(), state.tire_wear.tolist(), state.pit_timer.tolist(),
+            state.flags.tolist(), state.cumulative_time.tolist()
+        )
+        for code, values in zip(self._codes, columns):
+            (lap, progress, position, last_lap_time, compound, next_compound,
+             tire_age, tire_wear, pit_timer, flags, cumulative) = values
+            car = self.cars[code]
+            car.current_lap = lap
+            car.lap_progress = progress
+            car.position = position
+            car.last_lap_time = last_lap_time
+            car.compound = self._compounds[compound]
+            car.next_compound = self._compounds[next_compound]
+            car.tire_age = tire_age
+            car.tire_wear = tire_wear
+            car.pit_timer = pit_timer
+            car.in_pit, car.pit_requested, car.finished, car.dnf = flags
+            self.cumulative_times[code] = cumulative
+        
+        self.player_state.mode = state.mode
+        self.race_time = state.race_time
+        self.current_lap = state.player_lap
+        self._time_bank = 0.0
+        
+        self._lap_start[:] = state.lap_start
+        self._lap_duration[:] = state.lap_duration
+        self._lap_number[:] = state.current_lap
+        self._events = [
+            (start + duration, slot)
+            for slot, (start, duration) in enumerate(zip(state.lap_start.tolist(), state.lap_duration.tolist()))
+            if slot in self._ghost_set and duration != np.inf
+        ]
+        heapq.heapify(self._events)
+        
+        self.timing.times[:] = state.timing_times
+        self.timing.loops[:] = state.timing_loops
+        self.timing.last[:] = state.timing_last
+        self._crossed.clear()
+        
+        self.standings[:] = [self.cars[self._codes[slot]] for slot in state.order.tolist()]
+        self._update_lap_progress()
+        self._update_gaps(self.standings)
+        self._sync_track_positions()
+        self._sync_keyframes()
+    
+    def _capture_lap(self):
+        """
+        Snapshot the start of the player's current lap. Snapshots of later
+        laps belong to a different branch of the race and are dropped.
+        """
+        # Bring per-frame derived state (ghost progress, loops, standings) up
+        # to this step so the snapshot does not depend on frame timing
+        self._update_lap_progress()
+        self._recalculate_positions()
+        
+        lap = self.player_state.current_lap
+        for later in [l for l in self.lap_snapshots if l > lap]:
+            del self.lap_snapshots[later]
+        self.lap_snapshots[lap] = self.snapshot()
+    
+    def branch(self, lap: int) -> 'WhatIfSimEngine':
+        """
+        Start an independent what-if from the start of a captured player lap.
+        The new engine shares race data and models, and keeps the snapshots
+        up to that lap.
+        """
+        state = self.lap_snapshots[lap]
+        engine = WhatIfSimEngine(
+            race_data=self.race_data,
+            reference_telemetry=self.reference_telemetry,
+            physics=self.physics,
+            weather=self.weather,
+            player_driver=self.player_driver,
+            total_laps=self.total_laps,
+            telemetry_archive=self.telemetry_archive,
+            ghost_telemetry=self.ghost_telemetry
+        )
+        engine._compounds = list(self._compounds)
+        engine._compound_index = dict(self._compound_index)
+        engine.lap_snapshots = {l: snap for l, snap in self.lap_snapshots.items() if l <= lap}
+        engine.time_scale = self.time_scale
+        engine.restore(state)
+        return engine
     
     # === Player Actions ===
     
     def set_mode(self, mode: str):
         """Set player driving mode."""
-        if mode in ['PUSH', 'NORMAL', 'CONSERVE']:
+        if mode in ['PUSH', 'NORMAL', 'CONSERVE'] and mode != self.player_state.mode:
             self.player_state.mode = mode
+            self._drop_future()
     
     def request_pit(self, compound: str):
         """Request pit stop with specified compound."""
         if not self.player_state.in_pit and not self.player_state.pit_requested:
             self.player_state.pit_requested = True
             self.player_state.next_compound = compound
+            self._drop_future()
             return True
         return False
     
@@ -327,59 +967,241 @@ class WhatIfSimEngine:
         """Cancel pending pit request."""
         if self.player_state.pit_requested and not self.player_state.in_pit:
             self.player_state.pit_requested = False
+            self._drop_future()
             return True
         return False
     
     def jump_to_lap(self, target_lap: int):
-        """Jump all cars to a specific lap."""
+        """
+        Jump all cars to a specific lap.
+        
+        Laps the player has already driven are restored exactly from their
+        snapshot, what-if decisions included. Other laps are rebuilt from
+        historical data and start a new branch.
+        """
         target_lap = max(1, min(target_lap, self.total_laps))
         
-        for driver_code, car in self.cars.items():
-            driver_data = self.race_data[driver_code]
-            lap_data = self._get_lap_data(driver_data, target_lap)
-            
-            car.current_lap = target_lap
-            car.lap_progress = 0.0
-            car.finished = (target_lap > self.total_laps)
-            
-            if lap_data:
-                car.position = lap_data.position
-                car.compound = lap_data.compound
-                car.tire_age = lap_data.tire_life
-            
-            # Recalculate cumulative time
-            total_time = 0.0
-            for lap in driver_data.laps:
-                if lap.lap_number < target_lap:
-                    total_time += lap.lap_time_seconds
-            self.cumulative_times[driver_code] = total_time
-            
-            # Reset pit state
+        state = self.lap_snapshots.get(target_lap)
+        if state is not None:
+            self.restore(state)
+            return
+        
+        # The race clock goes to where the player really started the target
+        # lap; every ghost is placed where it really was at that moment
+        store, row = self._store, self._rows[self._slots[self.player_driver]]
+        self.race_time = float(store.lap_end_time[row, min(target_lap - 1, store.laps_run[row])])
+        self.current_lap = target_lap
+        
+        car = self.player_state
+        lap_data = self._get_lap_data(self.race_data[self.player_driver], target_lap)
+        car.current_lap = target_lap
+        car.lap_progress = 0.0
+        car.finished = (target_lap > self.total_laps)
+        if lap_data:
+            car.position = lap_data.position
+            car.compound = lap_data.compound
+            car.tire_age = lap_data.tire_life
+        self.cumulative_times[self.player_driver] = self.race_time
+        
+        # Reset pit state
+        car.in_pit = False
+        car.pit_requested = False
+        car.pit_timer = 0.0
+        
+        self._time_bank = 0.0
+        self._seek_ghosts(self.race_time)
+        self._reset_standings()
+        self._reset_timing()
+        self._recalculate_positions()
+        self._sync_track_positions()
+        self._capture_lap()
+        self._drop_future()
+        self._record_keyframe()
+    
+    def seek(self, race_time: float):
+        """
+        Move the race to any race time, forwards or backwards, mid-lap included.
+        
+        Ghosts are looked up in the race store. Inside the player's recorded
+        what-if, the player is restored from the last keyframe before race_time
+        and simulated alone for less than KEYFRAME_STEPS steps; up to
+        SEEK_AHEAD seconds past the end of it the player is simulated forward.
+        Anywhere else the player is put on its historical clock, which starts
+        a new branch. race_time is rounded down to a whole simulation step
+        and the standings are re-ranked at that moment.
+        """
+        self._time_bank = 0.0
+        self._seek(race_time)
+    
+    def _seek(self, race_time: float):
+        race_time = min(max(race_time, 0.0), self._race_end)
+        car = self.player_state
+        
+        i = bisect.bisect_right(self._key_times, race_time) - 1
+        steps = -1
+        if i >= 0:
+            steps = int((race_time - self._key_times[i]) / self.SIM_STEP + 1e-6)
+        last = i == len(self._key_times) - 1
+        if 0 <= steps < self.KEYFRAME_STEPS or (last and 0 <= steps * self.SIM_STEP <= self.SEEK_AHEAD):
+            self._restore_player(self._keyframes[i])
+            for _ in range(steps):
+                self._step_player()
+        else:
+            self._place_player(race_time)
+        
+        self.current_lap = car.current_lap
+        self._seek_ghosts(self.race_time)
+        self._reset_timing(player=False)
+        self._recalculate_positions()
+        self._sync_track_positions()
+    
+    def _step_player(self):
+        """One simulation step of the player alone; ghosts are placed afterwards."""
+        step_start = self.race_time
+        self.race_time += self.SIM_STEP
+        car = self.player_state
+        if not (car.finished or car.dnf):
+            self._update_player(car, step_start, self.SIM_STEP)
+        
+        self._key_steps += 1
+        if self._key_steps >= self.KEYFRAME_STEPS:
+            self._record_keyframe()
+    
+    def _place_player(self, race_time: float):
+        """Put the player where it really was at `race_time` (a new branch)."""
+        car = self.player_state
+        slot = self._slots[self.player_driver]
+        store, row = self._store, self._rows[slot]
+        laps_done, lap_starts = store.locate(self._rows[[slot]], race_time)
+        lap, lap_start = int(laps_done[0]) + 1, float(lap_starts[0])
+        
+        laps_run = int(store.laps_run[row])
+        lap_time = float(store.lap_time[row, lap]) if lap <= laps_run else np.inf
+        shown = min(lap, laps_run)
+        car.current_lap = lap
+        car.lap_progress = (race_time - lap_start) / lap_time if np.isfinite(lap_time) else 0.0
+        car.finished = lap > laps_run or lap > self.total_laps
+        if shown >= 1:
+            car.compound = store.compound_name(row, shown)
+            car.tire_age = int(store.tyre_life[row, shown])
+            car.position = int(store.position[row, shown])
+        if lap > 1:
+            car.last_lap_time = float(store.lap_time[row, lap - 1])
+        car.in_pit = False
+        car.pit_requested = False
+        car.pit_timer = 0.0
+        self.cumulative_times[self.player_driver] = lap_start
+        
+        self.timing.reset([slot])
+        self._time_history(slot, car, lap_start, lap_time)
+        
+        self.race_time = race_time
+        self._drop_future()
+        self._record_keyframe()
+    
+    def _restore_player(self, keyframe: PlayerKeyframe):
+        car = self.player_state
+        for name, value in zip(self.PLAYER_FIELDS, keyframe.values):
+            setattr(car, name, value)
+        self.cumulative_times[self.player_driver] = keyframe.cumulative_time
+        
+        slot = self._slots[self.player_driver]
+        self.timing.times[slot] = keyframe.timing_times
+        self.timing.loops[slot] = keyframe.timing_loops
+        self.timing.last[slot] = keyframe.timing_last
+        
+        self.race_time = keyframe.race_time
+        self._key_steps = 0
+    
+    def _record_keyframe(self):
+        """Keyframe the player now, replacing any keyframes from here on."""
+        car = self.player_state
+        slot = self._slots[self.player_driver]
+        i = bisect.bisect_left(self._key_times, self.race_time)
+        del self._key_times[i:]
+        del self._keyframes[i:]
+        self._key_times.append(self.race_time)
+        self._keyframes.append(PlayerKeyframe(
+            race_time=self.race_time,
+            values=tuple(getattr(car, name) for name in self.PLAYER_FIELDS),
+            cumulative_time=self.cumulative_times[self.player_driver],
+            timing_times=self.timing.times[slot].copy(),
+            timing_loops=self.timing.loops[slot].copy(),
+            timing_last=int(self.timing.last[slot])
+        ))
+        self._key_steps = 0
+    
+    def _sync_keyframes(self):
+        """Line the keyframe step counter up with race_time (after a restore)."""
+        i = bisect.bisect_right(self._key_times, self.race_time) - 1
+        steps = round((self.race_time - self._key_times[i]) / self.SIM_STEP) if i >= 0 else -1
+        if 0 <= steps < self.KEYFRAME_STEPS:
+            self._key_steps = steps
+        else:
+            self._record_keyframe()
+    
+    def _drop_future(self):
+        """
+        Forget keyframes and lap snapshots later than now: after a player
+        decision (or a jump onto the historical clock) they belong to a
+        different branch of the race.
+        """
+        i = bisect.bisect_right(self._key_times, self.race_time)
+        del self._key_times[i:]
+        del self._keyframes[i:]
+        for lap in [l for l, state in self.lap_snapshots.items() if state.race_time > self.race_time]:
+            del self.lap_snapshots[lap]
+    
+    def _seek_ghosts(self, race_time: float):
+        """
+        Put every ghost in its exact historical state at `race_time`: one
+        binary search per car in the store's race-time table, no replay.
+        """
+        store = self._store
+        rows = self._rows[self._ghost_slots]
+        laps_done, lap_starts = store.locate(rows, race_time)
+        
+        self._events = []
+        for car, slot, row, done, lap_start in zip(
+            self._ghosts, self._ghost_slots.tolist(), rows.tolist(), laps_done.tolist(), lap_starts.tolist()
+        ):
+            lap = done + 1
+            shown = min(lap, int(store.laps_run[row]))  # Last lap with data once finished
+            car.current_lap = lap
+            car.finished = lap > store.laps_run[row] or lap > self.total_laps
+            if shown >= 1:
+                car.compound = store.compound_name(row, shown)
+                car.tire_age = int(store.tyre_life[row, shown])
+                car.position = int(store.position[row, shown])
+            if lap > 1:
+                car.last_lap_time = float(store.lap_time[row, lap - 1])
             car.in_pit = False
             car.pit_requested = False
             car.pit_timer = 0.0
-            
-            self._sync_track_position(car)
+            self.cumulative_times[car.driver_code] = lap_start
+            self._schedule_ghost(slot, lap_start)
         
-        self.current_lap = target_lap
-        
-        # Estimate race time
-        self.race_time = sum(self.cumulative_times.values()) / len(self.cumulative_times)
+        self._update_lap_progress()
     
     def get_race_progress(self) -> float:
         """Get race progress as 0.0-1.0."""
-        leader = min(self.cars.values(), key=lambda c: c.position)
+        leader = self.standings[0]
         completed = (leader.current_lap - 1 + leader.lap_progress)
         return min(1.0, completed / self.total_laps)
     
     def set_race_progress(self, progress: float):
-        """Jump to a specific race progress point."""
-        target_lap = int(progress * self.total_laps) + 1
-        self.jump_to_lap(target_lap)
+        """
+        Seek to a race progress point: the race time at which the historical
+        leader had covered that fraction of the race distance.
+        """
+        store, row = self._store, self._clock_row
+        laps = int(store.laps_run[row])
+        distance = min(max(progress, 0.0), 1.0) * min(self.total_laps, laps)
+        self.seek(float(np.interp(distance, np.arange(laps + 1), store.lap_end_time[row, :laps + 1])))
     
     def get_sorted_cars(self) -> List[CarState]:
-        """Get cars sorted by position."""
-        return sorted(self.cars.values(), key=lambda c: c.position)
+        """Get cars sorted by position (the engine's live standings, do not modify)."""
+        return self.standings
     
     def get_player_position(self) -> int:
         """Get player's current position."""
@@ -0,0 +1,197 @@
+"""
+Strategy Sweep
+Evaluates thousands of pit stop / compound plans for one driver at once.
+Lap times are computed with the PhysicsModel formulas as (plans x laps) NumPy
+arrays and ranked against the historical ghost field.
+"""
+
+from dataclasses import dataclass
+from itertools import combinations, product
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .physics import PhysicsModel
+from .sim_engine import WhatIfSimEngine
+from .weather import WeatherSystem
+from ..data.loader import DriverRaceData
+
+
+@dataclass(frozen=True)
+class StrategyPlan:
+    """A complete race strategy: starting tire, pit stops and driving mode."""
+    start_compound: str
+    stops: Tuple[Tuple[int, str], ...] = ()  # (pit at end of lap, new compound)
+    mode: str = "NORMAL"
+    
+    def describe(self) -> str:
+        stints = [self.start_compound[0]] + [f"{lap}>{compound[0]}" for lap, compound in self.stops]
+        return " ".join(stints)
+
+
+class StrategySweep:
+    """
+    Vectorized strategy evaluation for a single driver.
+    
+    Uses the same lap model as WhatIfSimEngine.run_to_completion: the real lap
+    time is divided by the pace factor at the start of the lap, tires wear once
+    per lap, and a pit stop costs PIT_STOP_DURATION and resets the tires.
+    """
+    
+    PIT_STOP_DURATION = WhatIfSimEngine.PIT_STOP_DURATION
+    
+    def __init__(
+        self,
+        race_data: Dict[str, DriverRaceData],
+        physics: PhysicsModel,
+        weather: WeatherSystem,
+        player_driver: str,
+        total_laps: int
+    ):
+        self.race_data = race_data
+        self.physics = physics
+        self.weather = weather
+        self.player_driver = player_driver
+        self.total_laps = total_laps
+        
+        self.base_lap_times = self._consecutive_lap_times(race_data[player_driver])
+        self.laps = len(self.base_lap_times)
+        
+        # Ghost field: laps completed and race time, exactly as the engine replays them
+        ghosts = [
+            self._consecutive_lap_times(data)
+            for code, data in race_data.items() if code != player_driver
+        ]
+        self.ghost_laps = np.array([len(t) for t in ghosts], dtype=int)
+        self.ghost_times = np.array([t.sum() for t in ghosts])
+    
+    def _consecutive_lap_times(self, driver_data: DriverRaceData) -> np.ndarray:
+        """Lap times from lap 1 until the first missing lap (where replay stops)."""
+        times = []
+        for expected, lap in enumerate(driver_data.laps, start=1):
+            if lap.lap_number != expected or expected > self.total_laps:
+                break
+            times.append(lap.lap_time_seconds)
+        return np.array(times)
+    
+    def generate_plans(
+        self,
+        compounds: Sequence[str] = ('SOFT', 'MEDIUM', 'HARD'),
+        max_stops: int = 2,
+        min_stint: int = 5,
+        start_compound: Optional[str] = None,
+        modes: Sequence[str] = ('NORMAL',),
+        require_compound_change: bool = True
+    ) -> List[StrategyPlan]:
+        """
+        Build every 1..max_stops stop plan on the given compounds.
+        
+        Args:
+            compounds: Compounds allowed for every stint
+            max_stops: Maximum number of pit stops per plan
+            min_stint: Minimum laps per stint
+            start_compound: Fix the starting tire (default: the real one)
+            modes: Driving modes to combine with every plan
+            require_compound_change: Enforce the two dry compounds rule
+        """
+        if start_compound is None:
+            start_compound = self.race_data[self.player_driver].laps[0].compound
+        if start_compound not in compounds:
+            compounds = (start_compound,) + tuple(compounds)
+        
+        pit_laps = range(min_stint, self.laps - min_stint + 1)
+        plans = []
+        for n_stops in range(1, max_stops + 1):
+            for laps in combinations(pit_laps, n_stops):
+                if any(b - a < min_stint for a, b in zip(laps, laps[1:])):
+                    continue
+                for stint_compounds in product(compounds, repeat=n_stops):
+                    if require_compound_change and set(stint_compounds) == {start_compound}:
+                        continue
+                    for mode in modes:
+                        plans.append(StrategyPlan(
+                            start_compound=start_compound,
+                            stops=tuple(zip(laps, stint_compounds)),
+                            mode=mode
+                        ))
+        return plans
+    
+    def lap_time_matrix(self, plans: Sequence[StrategyPlan]) -> np.ndarray:
+        """
+        Player lap times for every plan.
+        
+        Returns:
+            Array of shape (plans, laps) with lap times in seconds, pit loss included
+        """
+        n_plans = len(plans)
+        max_stops = max((len(p.stops) for p in plans), default=0)
+        
+        # Pit laps padded with a lap that never comes, compounds per stint
+        pit_laps = np.full((n_plans, max_stops), self.laps + 1, dtype=int)
+        stint_compounds = np.zeros((n_plans, max_stops + 1), dtype=int)
+        for i, plan in enumerate(plans):
+            stint_compounds[i, 0] = self.physics.compound_code(plan.start_compound)
+            for j, (lap, compound) in enumerate(plan.stops):
+                pit_laps[i, j] = lap
+                stint_compounds[i, j + 1] = self.physics.compound_code(compound)
+        
+        lap_numbers = np.arange(1, self.laps + 1)
+        stint_idx = (pit_laps[:, None, :] < lap_numbers[None, :, None]).sum(axis=2)
+        compounds = np.take_along_axis(stint_compounds, stint_idx, axis=1)
+        pits = (pit_laps[:, None, :] == lap_numbers[None, :, None]).any(axis=2)
+        
+        modes = np.array([p.mode for p in plans])
+        lap_times = np.empty((n_plans, self.laps))
+        wear = np.zeros(n_plans)
+        elapsed = np.zeros(n_plans)
+        
+        # Laps are sequential (wear feeds the next lap), plans are not
+        for lap in range(self.laps):
+            rain = self.weather.get_weather_array(elapsed)
+            lap_time = np.empty(n_plans)
+            for mode in np.unique(modes):
+                sel = modes == mode
+                pace = self.physics.calculate_pace_factor_array(compounds[sel, lap], wear[sel], mode, rain[sel])
+                lap_time[sel] = self.base_lap_times[lap] / pace
+                wear[sel] = np.minimum(0.99, wear[sel] + self.physics.calculate_tire_wear_array(
+                    compounds[sel, lap], wear[sel], mode
+                ))
+            
+            lap_time += np.where(pits[:, lap], self.PIT_STOP_DURATION, 0.0)
+            wear = np.where(pits[:, lap], 0.0, wear)
+            lap_times[:, lap] = lap_time
+            elapsed += lap_time
+        
+        return lap_times
+    
+    def evaluate(self, plans: Sequence[StrategyPlan]) -> pd.DataFrame:
+        """
+        Rank plans by finishing position and race time against the ghost field.
+        
+        Returns:
+            DataFrame sorted best-first with one row per plan
+        """
+        if not plans:
+            return pd.DataFrame(columns=['plan', 'stops', 'pit_laps', 'compounds', 'mode',
+                                         'total_time', 'position', 'gap_to_best'])
+        
+        total_times = self.lap_time_matrix(plans).sum(axis=1)
+        
+        # Ghosts ahead: more laps completed, or same laps in less time
+        more_laps = (self.ghost_laps > self.laps).sum()
+        same_lap_times = np.sort(self.ghost_times[self.ghost_laps == self.laps])
+        positions = 1 + more_laps + np.searchsorted(same_lap_times, total_times)
+        
+        table = pd.DataFrame({
+            'plan': [p.describe() for p in plans],
+            'stops': [len(p.stops) for p in plans],
+            'pit_laps': [tuple(lap for lap, _ in p.stops) for p in plans],
+            'compounds': [(p.start_compound,) + tuple(c for _, c in p.stops) for p in plans],
+            'mode': [p.mode for p in plans],
+            'total_time': total_times,
+            'position': positions,
+        })
+        table = table.sort_values(['position', 'total_time'], kind='stable').reset_index(drop=True)
+        table['gap_to_best'] = table['total_time'] - table['total_time'].iloc[0]
+        return table
@@ -0,0 +1,81 @@
+"""
+Timing Loops
+Virtual mini-sector timing loops, like the loops buried in a real circuit.
+Gaps and intervals are measured where cars actually are on track instead of
+from lap totals that only change at the finish line.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+class TimingLoops:
+    """
+    Each lap is split into n_sectors mini-sectors. For every car, the race
+    time at which it crossed each loop is kept in a fixed-size ring buffer
+    covering the last history_laps laps.
+    
+    Loops are numbered over the whole race: loop k is crossed after k / n_sectors
+    laps of distance, so loop (lap - 1) * n_sectors is the line at the start
+    of `lap`. Recording a crossing and reading a gap are both O(1).
+    """
+    
+    def __init__(self, n_cars: int, n_sectors: int = 20, history_laps: int = 2):
+        self.n_sectors = n_sectors
+        self.size = n_sectors * history_laps
+        self.times = np.zeros((n_cars, self.size))
+        self.loops = np.full((n_cars, self.size), -1, dtype=np.int64)  # Loop held by each cell
+        self.last = np.full(n_cars, -1, dtype=np.int64)                # Latest loop crossed
+    
+    def reset(self, cars=None):
+        """Forget all crossings (e.g. after a jump), or only those of some cars."""
+        if cars is None:
+            self.loops.fill(-1)
+            self.last.fill(-1)
+        else:
+            self.loops[cars] = -1
+            self.last[cars] = -1
+    
+    def loop_at(self, lap: int, progress: float) -> int:
+        """Latest loop passed at a given lap and lap progress."""
+        return (lap - 1) * self.n_sectors + int(min(progress, 1.0) * self.n_sectors)
+    
+    def cross(self, car: int, loop: int, time: float):
+        """Record that a car crossed a loop at race time `time`."""
+        cell = loop % self.size
+        self.times[car, cell] = time
+        self.loops[car, cell] = loop
+        self.last[car] = loop
+    
+    def cross_lap(self, car: int, lap: int, lap_start: float, lap_time: float, progress: float) -> bool:
+        """
+        Record every loop of `lap` a car has passed up to `progress`, for a car
+        moving at a constant rate through the lap (it would start the lap at
+        lap_start and finish it lap_time later). progress 1.0 includes the line.
+        Returns True if any new loop was crossed.
+        """
+        first = max(int(self.last[car]) + 1, (lap - 1) * self.n_sectors)
+        upto = self.loop_at(lap, progress)
+        for loop in range(first, upto + 1):
+            sector = loop - (lap - 1) * self.n_sectors
+            self.cross(car, loop, lap_start + lap_time * sector / self.n_sectors)
+        return upto >= first
+    
+    def gap(self, car: int, ahead: int) -> Optional[float]:
+        """
+        Seconds between `ahead` and `car` at the last loop `car` crossed.
+        None if `ahead` has no record of that loop (not there yet, or more
+        than history_laps laps ahead).
+        """
+        loop = int(self.last[car])
+        if loop < 0:
+            return None
+        cell = loop % self.size
+        if self.loops[ahead, cell] != loop:
+            return None
+        return float(self.times[car, cell] - self.times[ahead, cell])
+    
+    def laps_behind(self, car: int, ahead: int) -> int:
+        """Whole laps between the latest loops crossed by two cars."""
+        return max(0, int(self.last[ahead] - self.last[car]) // self.n_sectors)
@@ -19,40 +19,13 @@ class WeatherSystem:
         self.track_temp: float = 30.0 # degrees C
         self.air_temp: float = 25.0
         
-    def load_from_session(self, session) -> None:
+    def load_from_table(self, historical_rain: Dict[int, float]) -> None:
         """
-        Load weather data from a FastF1 session.
+        Load a precomputed second -> rain intensity table, built by the data
+        layer (F1DataLoader.get_weather_table or a race snapshot).
         """
-        try:
-            # Get weather stream
-            weather_data = session.weather_data
-            
-            if weather_data.empty:
-                print("Warning: No weather data found in session.")
-                return
-                
-            # Create a simplified lookup table
-            # Normalize Rainfall: FastF1 gives boolean 'Rainfall', sometimes intensity
-            # We will approximate intensity based on 'Rainfall' and 'Humidity' if needed
-            # For now, simplistic mapping:
-            
-            for _, row in weather_data.iterrows():
-                # SessionTime is Timedelta
-                seconds = int(row['Time'].total_seconds())
-                
-                # Check different possible columns for rain info
-                is_raining = row.get('Rainfall', False)
-                
-                intensity = 0.0
-                if is_raining:
-                    intensity = 0.3 # Light rain default
-                    
-                self.historical_rain[seconds] = intensity
-                
-            print(f"Loaded {len(self.historical_rain)} weather points.")
-            
-        except Exception as e:
-            print(f"Error loading weather: {e}")
+        self.historical_rain = dict(historical_rain)
+        print(f"Loaded {len(self.historical_rain)} weather points.")
             
     def set_sandbox_rain(self, intensity: float):
         """
@@ -90,4 +63,21 @@ class WeatherSystem:
         # (A real robust implementation would use interpolation)
         
         return self.historical_rain.get(seconds_int, 0.0)
-
+    
+    def get_weather_array(self, time_seconds: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_current_weather for an array of race times.
+        """
+        time_seconds = np.asarray(time_seconds)
+        if self.sandbox_mode:
+            return np.full(time_seconds.shape, self.sandbox_intensity)
+        if not self.historical_rain:
+            return np.zeros(time_seconds.shape)
+        
+        keys = np.array(sorted(self.historical_rain))
+        values = np.array([self.historical_rain[k] for k in keys])
+        
+        # Same exact-second semantics as the scalar lookup
+        seconds_int = time_seconds.astype(np.int64)
+        idx = np.clip(np.searchsorted(keys, seconds_int), 0, len(keys) - 1)
+        return np.where(keys[idx] == seconds_int, values[idx], 0.0)
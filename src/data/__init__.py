@@ -1,5 +1,8 @@
 # Data layer - FastF1 loading and coordinate mapping
 from .loader import F1DataLoader
+from .load_job import LoadJob, LoadCancelled
 from .mapper import CoordinateMapper
+from .race_store import RaceStore
+from .telemetry_archive import TelemetryArchive
 
-__all__ = ['F1DataLoader', 'CoordinateMapper']
+__all__ = ['F1DataLoader', 'LoadJob', 'LoadCancelled', 'CoordinateMapper', 'RaceStore', 'TelemetryArchive']
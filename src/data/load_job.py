@@ -0,0 +1,81 @@
+"""
+Background Load Jobs
+Runs slow loading work (FastF1 downloads, race processing) on a daemon thread
+so the UI can keep pumping events, draw progress and cancel the load.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, Tuple
+
+
+class LoadCancelled(Exception):
+    """Raised inside a load job once it has been cancelled."""
+
+
+class LoadJob:
+    """
+    Handle to work running on a background thread.
+    
+    The work function receives the job and reports progress through
+    job.report(stage, current, total); each report is also a cancellation
+    point. The UI polls progress() and done() every frame.
+    
+    Usage:
+        job = LoadJob(lambda job: slow_load(job))
+        while not job.done():
+            stage, current, total = job.progress()
+        result = job.result()
+    """
+    
+    def __init__(self, work: Callable[['LoadJob'], Any], name: str = "load"):
+        self.future: Future = Future()
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._progress: Tuple[str, int, int] = ("Starting...", 0, 0)
+        
+        # Daemon thread: a FastF1 download that is still running when the
+        # window closes must not keep the process alive
+        self._thread = threading.Thread(target=self._run, args=(work,), name=name, daemon=True)
+        self._thread.start()
+    
+    def _run(self, work: Callable[['LoadJob'], Any]):
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = work(self)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+    
+    def report(self, stage: str, current: int = 0, total: int = 0):
+        """Publish progress from the worker. Raises LoadCancelled if cancelled."""
+        if self._cancelled.is_set():
+            raise LoadCancelled(stage)
+        with self._lock:
+            self._progress = (stage, current, total)
+    
+    def progress(self) -> Tuple[str, int, int]:
+        """Latest (stage, current, total); total is 0 when a stage has no count."""
+        with self._lock:
+            return self._progress
+    
+    def cancel(self):
+        """
+        Ask the job to stop at its next progress report.
+        A blocking call already in progress (e.g. session.load) runs to its
+        end on the abandoned thread.
+        """
+        self._cancelled.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+    
+    def done(self) -> bool:
+        return self.future.done()
+    
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Result of the work; re-raises its exception (LoadCancelled if cancelled)."""
+        return self.future.result(timeout)
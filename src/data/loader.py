@@ -5,15 +5,26 @@ Now loads FULL RACE data for authentic "What-If" simulation.
 """
 
 import os
+import socket
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
 from pathlib import Path
 from typing import List, Tuple, Optional, Dict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date
 
 import fastf1 as ff1
 import numpy as np
 import pandas as pd
 from scipy import interpolate
 
+from .load_job import LoadCancelled, LoadJob
+from .race_store import RaceStore
+from .schedule_index import ScheduleIndex
+from .snapshot import RaceSnapshot, SnapshotCache
+from .telemetry_archive import TelemetryArchive
+
 
 @dataclass
 class LapData:
@@ -30,32 +41,82 @@ class LapData:
 
 @dataclass 
 class DriverRaceData:
-    """Complete race data for a single driver."""
+    """
+    Complete race data for a single driver.
+    Thin view over one row of a RaceStore shared by all drivers.
+    """
     driver_code: str
     driver_name: str
     team: str
     team_color: Tuple[int, int, int]
-    laps: List[LapData]
-    final_position: int
-    total_laps: int
+    store: RaceStore = field(repr=False, compare=False)
+    index: int = field(repr=False)
+    _laps: Optional[List[LapData]] = field(default=None, init=False, repr=False, compare=False)
+    _lap_index: Optional[List[Optional[LapData]]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def laps(self) -> List[LapData]:
+        """Per-lap records, materialized on first access."""
+        if self._laps is None:
+            self.build_lap_index()
+        return self._laps
+    
+    def build_lap_index(self):
+        """
+        Materialize the LapData records and a dense lap-number index over them.
+        Index slot N holds lap N, or None where the timing data has a gap.
+        """
+        store, i = self.store, self.index
+        self._laps = [
+            LapData(
+                lap_number=int(lap),
+                lap_time_seconds=float(store.lap_time[i, lap]),
+                compound=store.compound_name(i, lap),
+                tire_life=int(store.tyre_life[i, lap]),
+                is_pit_out=bool(store.pit_out[i, lap]),
+                is_pit_in=bool(store.pit_in[i, lap]),
+                position=int(store.position[i, lap])
+            )
+            for lap in store.lap_numbers(i)
+        ]
+        self._lap_index = [None] * (store.max_lap + 1)
+        for lap_data in self._laps:
+            self._lap_index[lap_data.lap_number] = lap_data
+    
+    def get_lap(self, lap: int) -> Optional[LapData]:
+        """Get the record for a lap number in O(1), None if missing."""
+        if self._lap_index is None:
+            self.build_lap_index()
+        if 0 < lap < len(self._lap_index):
+            return self._lap_index[lap]
+        return None
+    
+    @property
+    def total_laps(self) -> int:
+        return self.store.lap_count(self.index)
+    
+    @property
+    def final_position(self) -> int:
+        laps = self.store.lap_numbers(self.index)
+        if len(laps) == 0:
+            return RaceStore.DEFAULT_POSITION
+        return int(self.store.position[self.index, laps[-1]])
     
     def get_position_at_lap(self, lap: int) -> int:
         """Get driver's position at a specific lap."""
-        for lap_data in self.laps:
-            if lap_data.lap_number == lap:
-                return lap_data.position
+        if self.store.has(self.index, lap):
+            return int(self.store.position[self.index, lap])
         return self.final_position
     
     def get_compound_at_lap(self, lap: int) -> str:
         """Get tire compound at specific lap."""
-        for lap_data in self.laps:
-            if lap_data.lap_number == lap:
-                return lap_data.compound
+        if self.store.has(self.index, lap):
+            return self.store.compound_name(self.index, lap)
         return "UNKNOWN"
     
     def get_pit_stops(self) -> List[int]:
         """Get list of laps where driver pitted."""
-        return [lap.lap_number for lap in self.laps if lap.is_pit_in]
+        return np.flatnonzero(self.store.pit_in[self.index] & self.store.has_lap[self.index]).tolist()
 
 
 # Team colors for rendering
@@ -83,20 +144,256 @@ class F1DataLoader:
     
     AVAILABLE_YEARS = [2022, 2023, 2024, 2025]
     
+    # Bump whenever processing changes so stale race snapshots are ignored
+    LOADER_VERSION = 3
+    
+    # Reference lap size, in points evenly spaced by distance
+    REFERENCE_LAP_POINTS = 400
+    
+    # Threads used to extract driver telemetry when building a telemetry archive
+    LOAD_WORKERS = 4
+    
+    # Loaded FastF1 sessions kept in memory while browsing races, least
+    # recently used evicted first; all are released once a race is built
+    SESSION_CACHE_SIZE = 3
+    
+    # Schedules of the current season are refetched once they are this old (seconds)
+    SCHEDULE_MAX_AGE = 24 * 3600
+    
+    # Reachability check of the F1 timing servers, run on a background thread
+    NETWORK_PROBE = ("livetiming.formula1.com", 443)
+    NETWORK_TIMEOUT = 1.5
+    
     def __init__(self, cache_dir: str = "./cache"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         ff1.Cache.enable_cache(str(self.cache_dir))
-        self._current_session: Optional[ff1.core.Session] = None
+        
+        # (year, gp, session_type) -> LoadJob resolving to the session.
+        # Prefetches run one at a time and queued ones are dropped by any
+        # newer request; confirmed loads never wait behind a prefetch.
+        self._sessions: 'OrderedDict[Tuple[int, str, str], LoadJob]' = OrderedDict()
+        self._sessions_lock = threading.Lock()
+        self._prefetch_lock = threading.Lock()
+        self._queued_sessions: set = set()
+        self._speculative_sessions: set = set()
+        
+        self.snapshots = SnapshotCache(self.cache_dir / "snapshots", self.LOADER_VERSION)
+        self.schedule_index = ScheduleIndex(self.cache_dir)
+        
+        # Last known reachability of the F1 servers (None until the first probe ends)
+        self._online: Optional[bool] = None
+        self._probe: Optional[threading.Thread] = None
+        self._probe_lock = threading.Lock()
+        self._start_network_probe()
+    
+    def load_race(
+        self,
+        year: int,
+        gp: str,
+        player_driver: str,
+        session_type: str = 'R',
+        progress_callback=None,
+        stage_callback=None
+    ) -> RaceSnapshot:
+        """
+        Load everything needed to simulate a race.
+        
+        Served from the snapshot cache when possible; otherwise the session is
+        loaded through FastF1, processed, and written back as a snapshot.
+        Reference telemetry is included for player_driver (or the first
+        driver with data if player_driver has none).
+        
+        Args:
+            progress_callback: Called as (driver, current, total) per driver
+            stage_callback: Called with a description as each stage starts
+        """
+        def stage(message: str):
+            if stage_callback:
+                stage_callback(message)
+        
+        stage("Checking snapshot cache...")
+        snapshot = self.snapshots.load(year, gp, session_type)
+        reference_driver = player_driver
+        if snapshot is not None:
+            if reference_driver not in snapshot.race_data and snapshot.race_data:
+                reference_driver = next(iter(snapshot.race_data))
+            if reference_driver in snapshot.reference_telemetry or not snapshot.race_data:
+                print(f"Loaded {year} {gp} from snapshot cache")
+                return snapshot
+        
+        stage(f"Loading {year} {gp} session...")
+        session = self.load_session(year, gp, session_type)
+        if snapshot is None:
+            stage("Processing drivers...")
+            race_data = self.load_full_race_data(session, progress_callback=progress_callback)
+            snapshot = RaceSnapshot(
+                drivers=self.get_drivers(session),
+                race_data=race_data,
+                track_coords=self.get_track_coordinates(session),
+                historical_rain=self.get_weather_table(session)
+            )
+            if reference_driver not in race_data and race_data:
+                reference_driver = next(iter(race_data))
+        
+        if snapshot.race_data:
+            stage(f"Extracting {reference_driver} reference lap...")
+            snapshot.reference_telemetry[reference_driver] = self.get_reference_lap_telemetry(session, reference_driver)
+            stage("Saving snapshot...")
+            self.snapshots.save(year, gp, session_type, snapshot)
+            self.schedule_index.add_local(year, gp)
+        return snapshot
+    
+    def load_race_async(
+        self,
+        year: int,
+        gp: str,
+        player_driver: str,
+        session_type: str = 'R',
+        telemetry_archive: bool = False
+    ) -> LoadJob:
+        """
+        Start load_race on a background thread.
+        
+        The job reports every stage and driver as progress, and its result is
+        a (RaceSnapshot, Optional[TelemetryArchive]) tuple. The archive is
+        only loaded (or built) when telemetry_archive is True.
+        """
+        def work(job: LoadJob):
+            def progress(driver, current, total):
+                job.report(f"Processing drivers: {driver}", current, total)
+            
+            race = self.load_race(
+                year, gp, player_driver, session_type,
+                progress_callback=progress,
+                stage_callback=job.report
+            )
+            archive = None
+            if telemetry_archive:
+                job.report("Loading telemetry archive...")
+                archive = self.get_telemetry_archive(
+                    year, gp, session_type,
+                    progress_callback=lambda driver, current, total: job.report(
+                        f"Building telemetry archive: {driver}", current, total
+                    ),
+                    workers=self.LOAD_WORKERS
+                )
+            # The race is built: the FastF1 sessions are no longer needed
+            self.release_sessions()
+            job.report("Done")
+            return race, archive
+        
+        return LoadJob(work, name=f"load {year} {gp}")
+    
+    def get_telemetry_archive(
+        self,
+        year: int,
+        gp: str,
+        session_type: str = 'R',
+        build: bool = True,
+        progress_callback=None,
+        workers: int = 1
+    ) -> Optional[TelemetryArchive]:
+        """
+        Memory-mapped telemetry for all drivers and laps of a session.
+        Built from the FastF1 session on first use (slow), then reopened from disk.
+        
+        Args:
+            build: If False, only return an archive that already exists
+            workers: Threads used to extract driver telemetry while building
+        """
+        base = self.snapshots.path(year, gp, session_type).with_suffix('')
+        archive = TelemetryArchive.open(base)
+        if archive is None and build:
+            session = self.load_session(year, gp, session_type)
+            drivers = [code for code, _ in self.get_drivers(session)]
+            print(f"Building telemetry archive for {len(drivers)} drivers...")
+            archive = TelemetryArchive.build(session, base, drivers, progress_callback, workers=workers)
+        return archive
+    
+    def get_driver_list(self, year: int, gp: str, session_type: str = 'R') -> List[Tuple[str, str]]:
+        """Drivers of a session, from the snapshot cache when available."""
+        snapshot = self.snapshots.load(year, gp, session_type)
+        if snapshot is not None:
+            return snapshot.drivers
+        return self.get_drivers(self.load_session(year, gp, session_type))
     
     def load_session(self, year: int, gp: str, session_type: str = 'R') -> ff1.core.Session:
-        """Load a race session from FastF1."""
-        print(f"Loading session: {year} {gp} - {session_type}...")
-        session = ff1.get_session(year, gp, session_type)
-        session.load()
-        self._current_session = session
-        print(f"Session loaded: {session.event['EventName']}")
-        return session
+        """
+        Load a race session from FastF1.
+        Reuses a session that is already loaded or still loading in the background.
+        """
+        return self._session_job((year, gp, session_type), speculative=False).result()
+    
+    def prefetch_session(self, year: int, gp: str, session_type: str = 'R') -> LoadJob:
+        """
+        Start loading a session in the background without waiting for it.
+        Queued prefetches of other sessions that have not started are dropped.
+        """
+        return self._session_job((year, gp, session_type), speculative=True)
+    
+    def prefetch_race(self, year: int, gp: str, session_type: str = 'R') -> Optional[LoadJob]:
+        """
+        Speculatively fetch what load_race will need: nothing when a snapshot
+        is already cached, otherwise the FastF1 session.
+        """
+        if self.snapshots.path(year, gp, session_type).exists():
+            return None
+        return self.prefetch_session(year, gp, session_type)
+    
+    def release_sessions(self):
+        """
+        Forget every loaded session and drop queued prefetches.
+        Loads already in progress finish for whoever is waiting on them.
+        """
+        with self._sessions_lock:
+            self._sessions.clear()
+            self._queued_sessions.clear()
+            self._speculative_sessions.clear()
+    
+    def _session_job(self, key: Tuple[int, str, str], speculative: bool) -> LoadJob:
+        with self._sessions_lock:
+            job = self._sessions.get(key)
+            # A confirmed load does not wait for its own prefetch to get its turn
+            queued_prefetch = not speculative and key in (self._queued_sessions & self._speculative_sessions)
+            if job is None or (job.done() and job.future.exception() is not None) or queued_prefetch:
+                job = LoadJob(lambda job: self._fetch_session(job, key, speculative), name=f"session {key}")
+                self._sessions[key] = job
+                self._queued_sessions.add(key)
+                if speculative:
+                    self._speculative_sessions.add(key)
+            self._sessions.move_to_end(key)
+            if not speculative:
+                self._speculative_sessions.discard(key)
+            
+            # Prefetches that have not started are no longer wanted
+            stale = (self._queued_sessions & self._speculative_sessions) - {key}
+            for other in stale:
+                del self._sessions[other]
+            
+            # Evict finished sessions only; in-flight jobs may have waiters
+            finished = [k for k, j in self._sessions.items() if j.done() and k != key]
+            for old_key in finished[:max(0, len(self._sessions) - self.SESSION_CACHE_SIZE)]:
+                del self._sessions[old_key]
+            self._queued_sessions &= set(self._sessions)
+            self._speculative_sessions &= set(self._sessions)
+            return job
+    
+    def _fetch_session(self, job: LoadJob, key: Tuple[int, str, str], speculative: bool) -> ff1.core.Session:
+        # A prefetch already inside session.load() cannot be interrupted, so
+        # confirmed loads run alongside it instead of queueing behind it
+        with self._prefetch_lock if speculative else nullcontext():
+            with self._sessions_lock:
+                if self._sessions.get(key) is not job:
+                    raise LoadCancelled(f"{key} is no longer wanted")
+                self._queued_sessions.discard(key)
+            
+            year, gp, session_type = key
+            print(f"Loading session: {year} {gp} - {session_type}...")
+            session = ff1.get_session(year, gp, session_type)
+            session.load()
+            print(f"Session loaded: {session.event['EventName']}")
+            return session
     
     def load_full_race_data(
         self,
@@ -107,109 +404,116 @@ class F1DataLoader:
         Load COMPLETE race data for ALL drivers.
         Includes all laps, pit stops, positions, and tire compounds.
         
+        Driver info is read in one pass over session.results and all laps in
+        one vectorized pass over session.laps. What is left per driver is a
+        few milliseconds of pure Python, so it runs on the calling thread;
+        progress_callback is called once per driver.
+        
         Returns:
             Dictionary mapping driver_code -> DriverRaceData
         """
-        all_drivers_data = {}
-        drivers = self.get_drivers(session)
-        total = len(drivers)
+        driver_info = self._get_driver_info(session)
+        codes = list(driver_info)
+        total = len(codes)
         
-        for i, (driver_code, driver_name) in enumerate(drivers):
+        # All laps of all drivers in one vectorized pass
+        store = RaceStore.from_laps(session.laps, codes)
+        
+        all_drivers_data = {}
+        for i, code in enumerate(codes):
             if progress_callback:
-                progress_callback(driver_code, i + 1, total)
-            
+                progress_callback(code, i + 1, total)
             try:
-                driver_data = self._load_driver_race_data(session, driver_code, driver_name)
-                if driver_data and len(driver_data.laps) > 0:
-                    all_drivers_data[driver_code] = driver_data
-                    print(f"  Loaded {driver_code}: {len(driver_data.laps)} laps, P{driver_data.final_position}")
+                driver_data = self._load_driver_race_data(store, code, *driver_info[code])
             except Exception as e:
-                print(f"  Error loading {driver_code}: {e}")
+                print(f"  Error loading {code}: {e}")
                 continue
+            if driver_data:
+                all_drivers_data[code] = driver_data
+                print(f"  Loaded {code}: {driver_data.total_laps} laps, P{driver_data.final_position}")
         
         return all_drivers_data
     
     def _load_driver_race_data(
         self, 
-        session: ff1.core.Session, 
+        store: RaceStore,
         driver_code: str,
-        driver_name: str
+        driver_name: str,
+        team: str
     ) -> Optional[DriverRaceData]:
-        """Load complete race data for a single driver."""
-        driver_laps = session.laps.pick_driver(driver_code)
-        
-        if driver_laps.empty:
+        """Wrap a driver's row of the race store with its team info."""
+        index = store.driver_index(driver_code)
+        if store.lap_count(index) == 0:
             return None
         
-        # Get driver info
-        try:
-            driver_info = session.get_driver(driver_code)
-            team = driver_info.get('TeamName', 'Unknown')
-            team_key = team.lower().replace(' ', '_').replace('-', '_')
-            team_color = TEAM_COLORS.get(team_key, (200, 200, 200))
-        except:
-            team = 'Unknown'
-            team_color = (200, 200, 200)
-        
-        # Process each lap
-        laps_data = []
-        for _, lap_row in driver_laps.iterrows():
-            lap_number = int(lap_row['LapNumber'])
-            
-            # Lap time (handle NaT)
-            lap_time = lap_row['LapTime']
-            if pd.isna(lap_time):
-                lap_time_seconds = 90.0  # Default estimate
-            else:
-                lap_time_seconds = lap_time.total_seconds()
-            
-            # Tire info
-            compound = str(lap_row.get('Compound', 'UNKNOWN')).upper()
-            tire_life = int(lap_row.get('TyreLife', 0)) if not pd.isna(lap_row.get('TyreLife')) else 0
-            
-            # Pit stop detection
-            is_pit_out = bool(lap_row.get('PitOutTime') is not None and not pd.isna(lap_row.get('PitOutTime')))
-            is_pit_in = bool(lap_row.get('PitInTime') is not None and not pd.isna(lap_row.get('PitInTime')))
-            
-            # Position
-            position = int(lap_row.get('Position', 20)) if not pd.isna(lap_row.get('Position')) else 20
-            
-            laps_data.append(LapData(
-                lap_number=lap_number,
-                lap_time_seconds=lap_time_seconds,
-                compound=compound,
-                tire_life=tire_life,
-                is_pit_out=is_pit_out,
-                is_pit_in=is_pit_in,
-                position=position
-            ))
-        
-        # Sort by lap number
-        laps_data.sort(key=lambda x: x.lap_number)
-        
-        # Final position
-        final_position = laps_data[-1].position if laps_data else 20
-        total_laps = len(laps_data)
-        
-        return DriverRaceData(
+        team_key = team.lower().replace(' ', '_').replace('-', '_')
+        team_color = TEAM_COLORS.get(team_key, (200, 200, 200))
+        
+        driver_data = DriverRaceData(
             driver_code=driver_code,
             driver_name=driver_name,
             team=team,
             team_color=team_color,
-            laps=laps_data,
-            final_position=final_position,
-            total_laps=total_laps
+            store=store,
+            index=index
         )
+        driver_data.build_lap_index()
+        return driver_data
+    
+    def _get_driver_info(self, session: ff1.core.Session) -> Dict[str, Tuple[str, str]]:
+        """
+        Driver code -> (full name, team) for every driver in the session.
+        Read from the session results table in one pass, falling back to
+        per-driver lookups when results are unavailable.
+        """
+        info: Dict[str, Tuple[str, str]] = {}
+        results = getattr(session, 'results', None)
+        columns = ['Abbreviation', 'FirstName', 'LastName', 'FullName', 'TeamName']
+        
+        if results is not None and not results.empty and 'Abbreviation' in results.columns:
+            table = results.reindex(columns=columns).dropna(subset=['Abbreviation'])
+            for code, first, last, full, team in table.itertuples(index=False):
+                team = team if isinstance(team, str) and team else 'Unknown'
+                info[code] = (self._driver_name(code, first, last, full), team)
+            return info
+        
+        for drv in session.drivers:
+            try:
+                driver = session.get_driver(drv)
+                code = driver['Abbreviation']
+                info[code] = (
+                    self._driver_name(code, driver.get('FirstName'), driver.get('LastName'), driver.get('FullName')),
+                    driver.get('TeamName', 'Unknown') or 'Unknown'
+                )
+            except Exception:
+                continue
+        return info
+    
+    @staticmethod
+    def _driver_name(code: str, first, last, full) -> str:
+        """First and last name, else the full name, else the driver code (missing values are NaN)."""
+        name = " ".join(part for part in (first, last) if isinstance(part, str) and part)
+        if name:
+            return name
+        if isinstance(full, str) and full:
+            return full
+        return code
     
     def get_reference_lap_telemetry(
         self, 
         session: ff1.core.Session, 
         driver: str,
-        resample_interval_ms: int = 100
+        resample_interval_ms: int = 100,
+        n_points: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Get a single reference lap telemetry for track shape.
         Used for rendering car positions on the circuit.
+        
+        Args:
+            resample_interval_ms: Time step when resampling by time
+            n_points: If given (default REFERENCE_LAP_POINTS), resample to this
+                      many points evenly spaced by distance along the lap instead
         """
         driver_laps = session.laps.pick_driver(driver)
         
@@ -226,6 +530,10 @@ class F1DataLoader:
         if telemetry.empty:
             raise ValueError(f"No telemetry data for driver {driver}")
         
+        if n_points is None:
+            n_points = self.REFERENCE_LAP_POINTS
+        if n_points:
+            return self._resample_telemetry_by_distance(telemetry, n_points)
         return self._resample_telemetry(telemetry, resample_interval_ms)
     
     def _resample_telemetry(
@@ -244,30 +552,72 @@ class F1DataLoader:
         time_ms = time_ms.values
         new_time_ms = np.arange(time_ms[0], time_ms[-1], interval_ms)
         
-        numeric_cols = ['X', 'Y', 'Speed', 'nGear', 'Throttle', 'Brake', 'RPM', 'DRS']
+        resampled_data = {'Time_ms': new_time_ms}
+        resampled_data.update(self._interpolate_channels(telemetry, time_ms, new_time_ms))
+        
+        return pd.DataFrame(resampled_data)
+    
+    def _resample_telemetry_by_distance(
+        self,
+        telemetry: pd.DataFrame,
+        n_points: int
+    ) -> pd.DataFrame:
+        """
+        Resample telemetry to points evenly spaced by arc length along X/Y.
+        Distance is replaced by the geometric arc length in track units.
+        """
+        telemetry = telemetry[telemetry['X'].notna() & telemetry['Y'].notna()]
+        x = telemetry['X'].values.astype(float)
+        y = telemetry['Y'].values.astype(float)
+        arc = np.concatenate(([0.0], np.cumsum(np.hypot(np.diff(x), np.diff(y)))))
+        
+        # Stationary samples repeat the same arc length; keep the first of each
+        moving = np.concatenate(([True], np.diff(arc) > 0))
+        telemetry, arc = telemetry[moving], arc[moving]
+        new_arc = np.linspace(0.0, arc[-1], n_points)
+        
+        if 'Time' in telemetry.columns:
+            time_ms = telemetry['Time'].dt.total_seconds().values * 1000
+        else:
+            time_ms = np.arange(len(telemetry)) * 50.0
+        
+        channels = self._interpolate_channels(telemetry.drop(columns=['Distance'], errors='ignore'), arc, new_arc)
+        resampled_data = {'Time_ms': np.interp(new_arc, arc, time_ms), 'Distance': new_arc}
+        resampled_data.update(channels)
+        
+        return pd.DataFrame(resampled_data)
+    
+    def _interpolate_channels(
+        self,
+        telemetry: pd.DataFrame,
+        axis: np.ndarray,
+        new_axis: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """Interpolate the numeric telemetry channels from axis onto new_axis."""
+        numeric_cols = ['X', 'Y', 'Distance', 'Speed', 'nGear', 'Throttle', 'Brake', 'RPM', 'DRS']
         available_cols = [c for c in numeric_cols if c in telemetry.columns]
         
-        resampled_data = {'Time_ms': new_time_ms}
+        resampled_data = {}
         
         for col in available_cols:
-            values = telemetry[col].values
+            values = telemetry[col].values.astype(float)
             valid_mask = ~np.isnan(values)
             
             if not np.any(valid_mask):
-                resampled_data[col] = np.zeros(len(new_time_ms))
+                resampled_data[col] = np.zeros(len(new_axis))
                 continue
             
             kind = 'nearest' if col in ['nGear', 'DRS'] else 'linear'
             interp_func = interpolate.interp1d(
-                time_ms[valid_mask], 
+                axis[valid_mask], 
                 values[valid_mask], 
                 kind=kind,
                 bounds_error=False,
                 fill_value='extrapolate'
             )
-            resampled_data[col] = interp_func(new_time_ms)
+            resampled_data[col] = interp_func(new_axis)
         
-        return pd.DataFrame(resampled_data)
+        return resampled_data
     
     def get_track_coordinates(self, session: ff1.core.Session) -> np.ndarray:
         """Extract track layout coordinates from session data."""
@@ -286,25 +636,91 @@ class F1DataLoader:
         
         return coords
     
+    @staticmethod
+    def get_weather_table(session: ff1.core.Session) -> Dict[int, float]:
+        """
+        Rain intensity per session second (0.0 - 1.0).
+        FastF1 only reports a boolean 'Rainfall', mapped to light rain.
+        """
+        weather_data = session.weather_data
+        if weather_data is None or weather_data.empty:
+            return {}
+        
+        seconds = weather_data['Time'].dt.total_seconds().astype(int)
+        if 'Rainfall' in weather_data.columns:
+            raining = weather_data['Rainfall'].fillna(False).astype(bool)
+        else:
+            raining = pd.Series(False, index=weather_data.index)
+        intensity = np.where(raining, 0.3, 0.0)  # Light rain default
+        
+        return dict(zip(seconds.tolist(), intensity.tolist()))
+    
     def get_available_races(self, year: int) -> List[str]:
-        """Get list of available races for a given year."""
+        """
+        Get list of available races for a given year.
+        
+        Listed from the local schedule index first; a schedule older than
+        SCHEDULE_MAX_AGE (current season only) is refreshed in the background.
+        Without a stored schedule, a fresh FastF1 schedule is fetched. While
+        the F1 servers are known to be unreachable, only races available
+        locally are listed, in schedule order, and the network is probed
+        again in the background for the next listing.
+        """
+        races = self.schedule_index.schedule(year)
+        online = self._network_status()
+        if not races and online is not False:
+            races = self._fetch_schedule(year)
+        elif races and online:
+            max_age = self.SCHEDULE_MAX_AGE if year >= date.today().year else None
+            if self.schedule_index.schedule(year, max_age) is None:
+                threading.Thread(target=self._fetch_schedule, args=(year,), name="schedule refresh", daemon=True).start()
+        if races and self._online is not False:
+            return races
+        
+        local = self.schedule_index.local_races(year)
+        races = races or []
+        races = [gp for gp in races if gp in local] + [gp for gp in local if gp not in races]
+        if races:
+            print(f"Offline: listing {len(races)} cached races for {year}")
+        return races
+    
+    def _fetch_schedule(self, year: int) -> Optional[List[str]]:
+        """Fetch and store a season schedule from FastF1; None (and offline) on failure."""
         try:
             schedule = ff1.get_event_schedule(year)
             races = schedule[schedule['EventFormat'] != 'testing']['EventName'].tolist()
-            return races
         except Exception as e:
             print(f"Error fetching schedule: {e}")
-            return []
+            self._online = False
+            return None
+        self.schedule_index.store_schedule(year, races)
+        self._online = True
+        return races
+    
+    def _network_status(self) -> Optional[bool]:
+        """
+        Last known reachability of the F1 servers, None while still unknown.
+        Never blocks: unless the servers are known to be reachable, a new
+        probe is started in the background.
+        """
+        if self._online is not True:
+            self._start_network_probe()
+        return self._online
+    
+    def _start_network_probe(self):
+        with self._probe_lock:
+            if self._probe is not None and self._probe.is_alive():
+                return
+            self._probe = threading.Thread(target=self._probe_network, name="network probe", daemon=True)
+            self._probe.start()
+    
+    def _probe_network(self):
+        try:
+            socket.create_connection(self.NETWORK_PROBE, timeout=self.NETWORK_TIMEOUT).close()
+            self._online = True
+        except OSError:
+            self._online = False
     
     def get_drivers(self, session: ff1.core.Session) -> List[Tuple[str, str]]:
         """Get list of drivers in a session."""
-        drivers = []
-        for drv in session.drivers:
-            try:
-                info = session.get_driver(drv)
-                code = info['Abbreviation']
-                name = f"{info['FirstName']} {info['LastName']}"
-                drivers.append((code, name))
-            except Exception:
-                continue
-        return drivers
+        return [(code, name) for code, (name, _) in self._get_driver_info(session).items()]
@@ -12,6 +12,9 @@ class CoordinateMapper:
     """
     Handles coordinate transformation from track space to screen pixels.
     Preserves aspect ratio and centers the track with configurable padding.
+    
+    `version` changes whenever the transform does (new track or resize), so
+    anything drawn with the transform can be cached against it.
     """
     
     def __init__(
@@ -38,8 +41,11 @@ class CoordinateMapper:
         self._offset_y: float = 0.0
         self._x_min: float = 0.0
         self._y_min: float = 0.0
+        self._x_max: float = 0.0
+        self._y_max: float = 0.0
+        self.version = 0
         
-        # Cache for transformed coordinates
+        # Cache for transformed coordinates, keyed by the track array itself
         self._cached_track: Optional[np.ndarray] = None
         self._cached_pixels: Optional[np.ndarray] = None
     
@@ -54,18 +60,21 @@ class CoordinateMapper:
         4. Calculate offset to center the track on screen
         5. Apply transformation to all points
         
+        The result is cached for the same array object (an O(1) check), so
+        the track array must not be modified in place after fitting. The
+        returned array is that cache, read-only; copy it to modify it.
+        
         Args:
             track_coords: numpy array of shape (N, 2) with X, Y coordinates
             
         Returns:
-            numpy array of shape (N, 2) with pixel coordinates
+            Read-only numpy array of shape (N, 2) with pixel coordinates
         """
         if len(track_coords) == 0:
             return np.array([])
         
         # Check cache
-        if (self._cached_track is not None and 
-            np.array_equal(track_coords, self._cached_track)):
+        if track_coords is self._cached_track:
             return self._cached_pixels
         
         # Step 1: Find bounding box
@@ -73,12 +82,27 @@ class CoordinateMapper:
         y_coords = track_coords[:, 1]
         
         self._x_min = np.min(x_coords)
-        x_max = np.max(x_coords)
+        self._x_max = np.max(x_coords)
         self._y_min = np.min(y_coords)
-        y_max = np.max(y_coords)
+        self._y_max = np.max(y_coords)
         
-        track_width = x_max - self._x_min
-        track_height = y_max - self._y_min
+        self._cached_track = track_coords
+        self._update_transform()
+        return self._cached_pixels
+    
+    def resize(self, screen_width: int, screen_height: int):
+        """Re-fit the current track to a new screen size."""
+        if (screen_width, screen_height) == (self.screen_width, self.screen_height):
+            return
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        if self._cached_track is not None:
+            self._update_transform()
+    
+    def _update_transform(self):
+        """Scale and offset for the track bounding box on the current screen."""
+        track_width = self._x_max - self._x_min
+        track_height = self._y_max - self._y_min
         
         # Avoid division by zero
         if track_width == 0:
@@ -103,15 +127,15 @@ class CoordinateMapper:
         self._offset_y = (self.screen_height - scaled_height) / 2
         
         # Step 5: Transform all coordinates
-        pixel_coords = np.zeros_like(track_coords)
-        pixel_coords[:, 0] = (x_coords - self._x_min) * self._scale + self._offset_x
-        pixel_coords[:, 1] = (y_coords - self._y_min) * self._scale + self._offset_y
+        track_coords = self._cached_track
+        pixel_coords = np.zeros_like(track_coords, dtype=np.float64)
+        pixel_coords[:, 0] = (track_coords[:, 0] - self._x_min) * self._scale + self._offset_x
+        pixel_coords[:, 1] = (track_coords[:, 1] - self._y_min) * self._scale + self._offset_y
         
         # Cache results
-        self._cached_track = track_coords.copy()
-        self._cached_pixels = pixel_coords.copy()
-        
-        return pixel_coords
+        pixel_coords.flags.writeable = False  # Shared with every fit_to_screen caller
+        self._cached_pixels = pixel_coords
+        self.version += 1
     
     def geo_to_pixel(self, geo_x: float, geo_y: float) -> Tuple[int, int]:
         """
@@ -131,6 +155,20 @@ class CoordinateMapper:
         
         return (int(pixel_x), int(pixel_y))
     
+    def geo_to_pixel_many(self, geo_x: np.ndarray, geo_y: np.ndarray) -> np.ndarray:
+        """
+        Vectorized geo_to_pixel for many points at once.
+        
+        Returns:
+            int array of shape (N, 2) with the same values geo_to_pixel gives
+        """
+        pixels = np.empty((len(geo_x), 2))
+        np.multiply(np.subtract(geo_x, self._x_min), self._scale, out=pixels[:, 0])
+        np.multiply(np.subtract(geo_y, self._y_min), self._scale, out=pixels[:, 1])
+        pixels[:, 0] += self._offset_x
+        pixels[:, 1] += self._offset_y
+        return pixels.astype(np.int64)
+    
     def pixel_to_geo(self, pixel_x: int, pixel_y: int) -> Tuple[float, float]:
         """
         Convert pixel position back to geographic coordinates.
@@ -0,0 +1,170 @@
+"""
+Race Store
+Columnar lap data for every driver of a session.
+Each field is one NumPy array of shape (drivers, max_lap + 1), indexed
+directly by lap number, so any (driver, lap) lookup is O(1).
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class RaceStore:
+    """
+    Lap-by-lap race data for all drivers as a set of dense arrays.
+    
+    Column 0 is unused so that array[driver_idx, lap_number] works without
+    offsets. Laps missing from the timing data have has_lap == False.
+    
+    Derived race-time tables make a driver's historical state at any race
+    time a binary search away:
+        laps_run      - laps driven without a gap from lap 1 (a replay ends there)
+        lap_end_time  - race time at the end of each lap (column 0 = start, 0.0);
+                        inf for laps after laps_run
+    """
+    
+    DEFAULT_LAP_TIME = 90.0   # Used when a lap exists but its time is NaT
+    DEFAULT_POSITION = 20
+    
+    def __init__(
+        self,
+        driver_codes: Sequence[str],
+        compound_names: Sequence[str],
+        lap_time: np.ndarray,
+        compound: np.ndarray,
+        tyre_life: np.ndarray,
+        pit_in: np.ndarray,
+        pit_out: np.ndarray,
+        position: np.ndarray,
+        has_lap: np.ndarray
+    ):
+        self.driver_codes: List[str] = list(driver_codes)
+        self.compound_names: List[str] = list(compound_names)
+        self.lap_time = lap_time
+        self.compound = compound
+        self.tyre_life = tyre_life
+        self.pit_in = pit_in
+        self.pit_out = pit_out
+        self.position = position
+        self.has_lap = has_lap
+        
+        self._index: Dict[str, int] = {code: i for i, code in enumerate(self.driver_codes)}
+        self._build_time_tables()
+    
+    def _build_time_tables(self):
+        n_drivers, n_cols = self.has_lap.shape
+        missing = ~self.has_lap[:, 1:]
+        self.laps_run = np.where(missing.any(axis=1), missing.argmax(axis=1), n_cols - 1).astype(np.int64)
+        
+        reachable = np.arange(n_cols)[None, :] <= self.laps_run[:, None]
+        reachable[:, 0] = False
+        durations = np.where(reachable, np.nan_to_num(self.lap_time), 0.0)
+        self.lap_end_time = np.cumsum(durations, axis=1)
+        self.lap_end_time[~reachable] = np.inf
+        self.lap_end_time[:, 0] = 0.0
+        
+        # All rows in one sorted array for a single searchsorted over many
+        # drivers: row d is shifted by d * 2 * span and unreachable laps are
+        # clamped to span, so rows never overlap
+        finite = self.lap_end_time[np.isfinite(self.lap_end_time)]
+        self._span = float(finite.max()) + 1.0 if finite.size else 1.0
+        shifted = np.minimum(self.lap_end_time[:, 1:], self._span)
+        shifted += (np.arange(n_drivers) * 2 * self._span)[:, None]
+        self._search_key = shifted.ravel()
+    
+    @classmethod
+    def from_laps(cls, laps: pd.DataFrame, driver_codes: Sequence[str]) -> 'RaceStore':
+        """
+        Build the store from a FastF1 laps table in one vectorized pass.
+        
+        Args:
+            laps: session.laps (or any frame with the same columns)
+            driver_codes: Driver abbreviations, defines the row order
+        """
+        index = {code: i for i, code in enumerate(driver_codes)}
+        laps = laps[laps['Driver'].isin(list(index)) & laps['LapNumber'].notna()]
+        
+        rows = laps['Driver'].map(index).to_numpy(dtype=np.intp)
+        lap_numbers = laps['LapNumber'].to_numpy().astype(np.intp)
+        max_lap = int(lap_numbers.max()) if len(lap_numbers) else 0
+        shape = (len(driver_codes), max_lap + 1)
+        
+        def column(name: str) -> pd.Series:
+            if name in laps.columns:
+                return laps[name]
+            return pd.Series(np.nan, index=laps.index)
+        
+        compound_codes, compound_names = pd.factorize(
+            column('Compound').fillna('UNKNOWN').astype(str).str.upper()
+        )
+        
+        lap_time = np.full(shape, np.nan)
+        lap_time[rows, lap_numbers] = (
+            pd.to_timedelta(column('LapTime')).dt.total_seconds().fillna(cls.DEFAULT_LAP_TIME).to_numpy()
+        )
+        
+        compound = np.full(shape, -1, dtype=np.int8)
+        compound[rows, lap_numbers] = compound_codes
+        
+        tyre_life = np.zeros(shape, dtype=np.int16)
+        tyre_life[rows, lap_numbers] = column('TyreLife').fillna(0).to_numpy().astype(np.int16)
+        
+        pit_in = np.zeros(shape, dtype=bool)
+        pit_in[rows, lap_numbers] = column('PitInTime').notna().to_numpy()
+        
+        pit_out = np.zeros(shape, dtype=bool)
+        pit_out[rows, lap_numbers] = column('PitOutTime').notna().to_numpy()
+        
+        position = np.full(shape, cls.DEFAULT_POSITION, dtype=np.int16)
+        position[rows, lap_numbers] = column('Position').fillna(cls.DEFAULT_POSITION).to_numpy().astype(np.int16)
+        
+        has_lap = np.zeros(shape, dtype=bool)
+        has_lap[rows, lap_numbers] = True
+        
+        return cls(driver_codes, compound_names, lap_time, compound, tyre_life,
+                   pit_in, pit_out, position, has_lap)
+    
+    @property
+    def max_lap(self) -> int:
+        return self.has_lap.shape[1] - 1
+    
+    @property
+    def nbytes(self) -> int:
+        """Total memory held by the lap arrays."""
+        arrays = (self.lap_time, self.compound, self.tyre_life, self.pit_in,
+                  self.pit_out, self.position, self.has_lap)
+        return sum(a.nbytes for a in arrays)
+    
+    def driver_index(self, driver_code: str) -> int:
+        return self._index[driver_code]
+    
+    def has(self, driver_idx: int, lap: int) -> bool:
+        return 0 < lap <= self.max_lap and bool(self.has_lap[driver_idx, lap])
+    
+    def lap_numbers(self, driver_idx: int) -> np.ndarray:
+        """Sorted lap numbers with data for a driver."""
+        return np.flatnonzero(self.has_lap[driver_idx])
+    
+    def lap_count(self, driver_idx: int) -> int:
+        return int(self.has_lap[driver_idx].sum())
+    
+    def locate(self, rows: np.ndarray, race_time: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Historical state of several drivers at a race time, by binary search.
+        
+        Returns:
+            (laps completed, race time at which the current lap started),
+            one entry per row. A driver past laps_run has completed them all.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        n_cols = self.has_lap.shape[1] - 1
+        t = min(max(race_time, 0.0), self._span - 0.5)
+        query = t + rows * 2 * self._span
+        done = np.searchsorted(self._search_key, query, side='right') - rows * n_cols
+        done = np.minimum(done, self.laps_run[rows])
+        return done, self.lap_end_time[rows, done]
+    
+    def compound_name(self, driver_idx: int, lap: int) -> str:
+        return self.compound_names[self.compound[driver_idx, lap]]
@@ -0,0 +1,119 @@
+"""
+Schedule Index
+Persistent season index so the menu can list races without the network.
+Combines schedules fetched from FastF1 earlier with the races that are
+actually available locally (FastF1 cache folders and loaded races).
+"""
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class ScheduleIndex:
+    """
+    JSON index stored at <cache_dir>/schedule_index.json:
+        schedules - year -> {"fetched": unix time, "races": [event names]}
+        local     - year -> [event names available offline]
+    """
+    
+    VERSION = 1
+    FILENAME = "schedule_index.json"
+    
+    # FastF1 cache layout: <year>/<date>_<Event_Name>/<date>_<Session_Name>/
+    EVENT_DIR = re.compile(r'^(\d{4}-\d{2}-\d{2})_(.+)$')
+    
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.path = self.cache_dir / self.FILENAME
+        self.schedules: Dict[str, dict] = {}
+        self.local: Dict[str, List[str]] = {}
+        self._scanned = False
+        self._lock = threading.Lock()  # Races are recorded from loader threads
+        self._read()
+    
+    def _read(self):
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if data.get('version') == self.VERSION:
+            self.schedules = data.get('schedules', {})
+            self.local = data.get('local', {})
+    
+    def _write(self):
+        """Save the index. Callers hold _lock, so nothing changes while it is serialized."""
+        data = {'version': self.VERSION, 'schedules': self.schedules, 'local': self.local}
+        tmp = self.path.with_suffix('.tmp')
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(data, indent=1, ensure_ascii=False), encoding='utf-8')
+            tmp.replace(self.path)
+        except OSError as e:
+            print(f"Could not write schedule index: {e}")
+    
+    def scan(self):
+        """Add every race with a cached FastF1 race session to the local index."""
+        found: Dict[str, List[str]] = {}
+        for year_dir in sorted(self.cache_dir.glob('[0-9][0-9][0-9][0-9]')):
+            events = []
+            for event_dir in sorted(p for p in year_dir.iterdir() if p.is_dir()):
+                match = self.EVENT_DIR.match(event_dir.name)
+                has_race = any(
+                    p.name.endswith('_Race') and any(p.glob('*.ff1pkl'))
+                    for p in event_dir.iterdir() if p.is_dir()
+                )
+                if match and has_race:
+                    events.append(match.group(2).replace('_', ' '))
+            if events:
+                found[year_dir.name] = events
+        
+        with self._lock:
+            changed = False
+            for year, events in found.items():
+                known = self.local.setdefault(year, [])
+                for name in events:
+                    if name not in known:
+                        known.append(name)
+                        changed = True
+            self._scanned = True
+            if changed:
+                self._write()
+    
+    def local_races(self, year: int) -> List[str]:
+        """Races of a season that can be loaded without the network."""
+        if not self._scanned:
+            self.scan()
+        with self._lock:
+            return list(self.local.get(str(year), []))
+    
+    def add_local(self, year: int, gp: str):
+        """Record a race that has just been loaded (and cached)."""
+        with self._lock:
+            known = self.local.setdefault(str(year), [])
+            if gp not in known:
+                known.append(gp)
+                self._write()
+    
+    def schedule(self, year: int, max_age: Optional[float] = None) -> Optional[List[str]]:
+        """
+        A previously fetched season schedule, or None.
+        
+        Args:
+            max_age: Ignore schedules fetched longer ago than this (seconds)
+        """
+        with self._lock:
+            entry = self.schedules.get(str(year))
+        if entry is None:
+            return None
+        if max_age is not None and time.time() - entry.get('fetched', 0) > max_age:
+            return None
+        return list(entry['races'])
+    
+    def store_schedule(self, year: int, races: List[str]):
+        with self._lock:
+            self.schedules[str(year)] = {'fetched': time.time(), 'races': list(races)}
+            self._write()
@@ -0,0 +1,130 @@
+"""
+Race Snapshot Cache
+Stores the fully processed outputs of a session load (race store, driver info,
+reference telemetry, track layout and weather table) as one compressed .npz
+file, so a warm start never has to touch FastF1.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .race_store import RaceStore
+
+if TYPE_CHECKING:
+    from .loader import DriverRaceData
+
+
+@dataclass
+class RaceSnapshot:
+    """Everything the simulator needs from a session, already processed."""
+    drivers: List[Tuple[str, str]]                # (code, name) for every driver in the session
+    race_data: Dict[str, 'DriverRaceData']
+    track_coords: np.ndarray
+    historical_rain: Dict[int, float]
+    reference_telemetry: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    
+    @property
+    def total_laps(self) -> int:
+        return max((d.total_laps for d in self.race_data.values()), default=0)
+
+
+class SnapshotCache:
+    """
+    On-disk cache of RaceSnapshot files.
+    Keyed by (year, GP, session type, loader version): bumping the loader
+    version invalidates every snapshot written by older processing code.
+    """
+    
+    STORE_FIELDS = ('lap_time', 'compound', 'tyre_life', 'pit_in', 'pit_out', 'position', 'has_lap')
+    
+    def __init__(self, cache_dir: Path, version: int):
+        self.cache_dir = Path(cache_dir)
+        self.version = version
+    
+    def path(self, year: int, gp: str, session_type: str) -> Path:
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', gp).strip('_')
+        return self.cache_dir / f"{year}_{slug}_{session_type}_v{self.version}.npz"
+    
+    def save(self, year: int, gp: str, session_type: str, snapshot: RaceSnapshot) -> Path:
+        """Write a snapshot atomically."""
+        store = next(iter(snapshot.race_data.values())).store
+        meta = {
+            'version': self.version,
+            'drivers': snapshot.drivers,
+            'store_drivers': store.driver_codes,
+            'compound_names': store.compound_names,
+            'race_drivers': [
+                [d.driver_code, d.driver_name, d.team, list(d.team_color)]
+                for d in snapshot.race_data.values()
+            ],
+            'references': {code: list(df.columns) for code, df in snapshot.reference_telemetry.items()},
+        }
+        
+        arrays = {f'store__{name}': getattr(store, name) for name in self.STORE_FIELDS}
+        arrays['track_coords'] = snapshot.track_coords
+        arrays['rain_seconds'] = np.array(list(snapshot.historical_rain.keys()), dtype=np.int64)
+        arrays['rain_intensity'] = np.array(list(snapshot.historical_rain.values()), dtype=np.float64)
+        for code, df in snapshot.reference_telemetry.items():
+            for col in df.columns:
+                arrays[f'ref__{code}__{col}'] = df[col].to_numpy()
+        
+        path = self.path(year, gp, session_type)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp.npz')
+        np.savez_compressed(tmp, meta=np.array(json.dumps(meta)), **arrays)
+        tmp.replace(path)
+        return path
+    
+    def load(self, year: int, gp: str, session_type: str) -> Optional[RaceSnapshot]:
+        """Read a snapshot, or None if there is no usable one."""
+        from .loader import DriverRaceData
+        
+        path = self.path(year, gp, session_type)
+        if not path.exists():
+            return None
+        
+        try:
+            with np.load(path, allow_pickle=False) as npz:
+                meta = json.loads(str(npz['meta']))
+                if meta.get('version') != self.version:
+                    return None
+                
+                store = RaceStore(
+                    meta['store_drivers'],
+                    meta['compound_names'],
+                    *(npz[f'store__{name}'] for name in self.STORE_FIELDS)
+                )
+                race_data = {}
+                for code, name, team, color in meta['race_drivers']:
+                    driver_data = DriverRaceData(
+                        driver_code=code,
+                        driver_name=name,
+                        team=team,
+                        team_color=tuple(color),
+                        store=store,
+                        index=store.driver_index(code)
+                    )
+                    driver_data.build_lap_index()
+                    race_data[code] = driver_data
+                
+                reference_telemetry = {
+                    code: pd.DataFrame({col: npz[f'ref__{code}__{col}'] for col in cols})
+                    for code, cols in meta['references'].items()
+                }
+                
+                return RaceSnapshot(
+                    drivers=[tuple(d) for d in meta['drivers']],
+                    race_data=race_data,
+                    track_coords=npz['track_coords'],
+                    historical_rain=dict(zip(npz['rain_seconds'].tolist(), npz['rain_intensity'].tolist())),
+                    reference_telemetry=reference_telemetry
+                )
+        except Exception as e:
+            print(f"Ignoring unreadable snapshot {path.name}: {e}")
+            return None
@@ -0,0 +1,177 @@
+"""
+Telemetry Archive
+Full-race telemetry for every driver and lap in one flat, fixed-dtype binary
+file that is memory-mapped on open. A (driver, lap) -> sample range index
+makes any lap readable as a zero-copy slice without keeping DataFrames in RAM.
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class TelemetryArchive:
+    """
+    Memory-mapped telemetry samples for a whole session.
+    
+    Files (sharing one base path):
+        <base>.tel.bin    - samples, TelemetryArchive.DTYPE records, lap after lap
+        <base>.tel.npz    - start/stop sample offsets, shape (drivers, max_lap + 1)
+    
+    Time and Distance are relative to the start of each lap.
+    """
+    
+    DTYPE = np.dtype([
+        ('Time', 'f4'),       # Seconds since lap start
+        ('Distance', 'f4'),   # Meters since lap start
+        ('X', 'f4'),
+        ('Y', 'f4'),
+        ('Speed', 'f4'),
+        ('Throttle', 'f4'),
+        ('Brake', 'u1'),
+        ('nGear', 'i1'),
+        ('DRS', 'u1'),
+        ('RPM', 'f4'),
+    ])
+    
+    def __init__(self, samples: np.ndarray, driver_codes: Sequence[str], start: np.ndarray, stop: np.ndarray):
+        self.samples = samples
+        self.driver_codes: List[str] = list(driver_codes)
+        self.start = start
+        self.stop = stop
+        self._index: Dict[str, int] = {code: i for i, code in enumerate(self.driver_codes)}
+    
+    @staticmethod
+    def _paths(base: Path):
+        base = Path(base)
+        return base.with_name(base.name + '.tel.bin'), base.with_name(base.name + '.tel.npz')
+    
+    @classmethod
+    def open(cls, base: Path) -> Optional['TelemetryArchive']:
+        """Memory-map an existing archive, or None if it has not been built."""
+        data_path, index_path = cls._paths(base)
+        if not (data_path.exists() and index_path.exists()):
+            return None
+        
+        with np.load(index_path, allow_pickle=False) as index:
+            meta = json.loads(str(index['meta']))
+            start, stop = index['start'], index['stop']
+        
+        if data_path.stat().st_size == 0:
+            samples = np.zeros(0, dtype=cls.DTYPE)
+        else:
+            samples = np.memmap(data_path, dtype=cls.DTYPE, mode='r')
+        return cls(samples, meta['drivers'], start, stop)
+    
+    @classmethod
+    def build(
+        cls,
+        session,
+        base: Path,
+        driver_codes: Sequence[str],
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        workers: int = 1
+    ) -> 'TelemetryArchive':
+        """
+        Extract telemetry for every driver from a loaded FastF1 session.
+        Each driver is streamed to disk as soon as it is extracted; with
+        workers > 1 extraction runs on a thread pool, while writes and
+        progress callbacks stay on the calling thread.
+        """
+        data_path, index_path = cls._paths(base)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        max_lap = int(session.laps['LapNumber'].max())
+        start = np.zeros((len(driver_codes), max_lap + 1), dtype=np.int64)
+        stop = np.zeros_like(start)
+        written = 0
+        
+        def extract(code: str):
+            try:
+                return cls._extract_driver(session, code)
+            except Exception as e:
+                print(f"  No telemetry for {code}: {e}")
+                return None
+        
+        if workers > 1:
+            pool = ThreadPoolExecutor(max_workers=workers)
+            futures = {pool.submit(extract, code): code for code in driver_codes}
+            extracted = ((futures[f], f.result()) for f in as_completed(futures))
+        else:
+            pool = None
+            extracted = ((code, extract(code)) for code in driver_codes)
+        
+        tmp_path = data_path.with_name(data_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as out:
+                for done, (code, result) in enumerate(extracted):
+                    if progress_callback:
+                        progress_callback(code, done + 1, len(driver_codes))
+                    if result is None:
+                        continue
+                    records, lap_numbers = result
+                    i = driver_codes.index(code)
+                    
+                    # Samples are time-ordered, so each lap is one contiguous run
+                    laps, first, counts = np.unique(lap_numbers, return_index=True, return_counts=True)
+                    start[i, laps] = written + first
+                    stop[i, laps] = written + first + counts
+                    
+                    records.tofile(out)
+                    written += len(records)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        tmp_path.replace(data_path)
+        np.savez(index_path, meta=np.array(json.dumps({'drivers': list(driver_codes)})), start=start, stop=stop)
+        
+        return cls.open(base)
+    
+    @classmethod
+    def _extract_driver(cls, session, driver_code: str):
+        """One driver's merged telemetry as DTYPE records plus the lap of each sample."""
+        driver_laps = session.laps.pick_driver(driver_code).sort_values('LapNumber')
+        driver_laps = driver_laps[driver_laps['LapStartTime'].notna()]
+        telemetry = driver_laps.get_telemetry()
+        
+        lap_starts = driver_laps['LapStartTime'].dt.total_seconds().to_numpy()
+        lap_numbers = driver_laps['LapNumber'].to_numpy().astype(np.int64)
+        session_time = telemetry['SessionTime'].dt.total_seconds().to_numpy()
+        
+        # Lap each sample belongs to; drop anything before the first lap
+        lap_idx = np.searchsorted(lap_starts, session_time, side='right') - 1
+        valid = lap_idx >= 0
+        lap_idx = lap_idx[valid]
+        
+        distance = telemetry['Distance'].to_numpy()[valid]
+        first_of_lap = np.r_[True, lap_idx[1:] != lap_idx[:-1]]
+        lap_distance0 = np.maximum.accumulate(np.where(first_of_lap, np.arange(len(lap_idx)), 0))
+        
+        records = np.zeros(len(lap_idx), dtype=cls.DTYPE)
+        records['Time'] = session_time[valid] - lap_starts[lap_idx]
+        records['Distance'] = distance - distance[lap_distance0]
+        for name in ('X', 'Y', 'Speed', 'Throttle', 'Brake', 'nGear', 'DRS', 'RPM'):
+            if name in telemetry.columns:
+                records[name] = np.nan_to_num(telemetry[name].to_numpy(dtype=float)[valid])
+        
+        return records, lap_numbers[lap_idx]
+    
+    def has_lap(self, driver_code: str, lap: int) -> bool:
+        i = self._index.get(driver_code)
+        if i is None or not (0 < lap < self.start.shape[1]):
+            return False
+        return self.stop[i, lap] > self.start[i, lap]
+    
+    def get_lap(self, driver_code: str, lap: int) -> np.ndarray:
+        """
+        Telemetry samples of one lap as a read-only view into the archive.
+        Empty if the lap is not in the archive.
+        """
+        if not self.has_lap(driver_code, lap):
+            return self.samples[:0]
+        i = self._index[driver_code]
+        return self.samples[self.start[i, lap]:self.stop[i, lap]]
@@ -0,0 +1,112 @@
+"""
+Layered Screen
+Dirty-rectangle compositing for the race view. Static layers (track, panel
+frames, timeline ticks) are painted once into a background surface; dynamic
+items are repainted only when they change, and only their rectangles are
+pushed to the display.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+
+class LayeredScreen:
+    """
+    Frame protocol:
+        layers.static(name, key, paint)      - paint(background) when key changes
+        layers.add(name, key, rect, draw)    - dynamic items, bottom to top
+        rects = layers.compose()             - repaint, then display.update(rects)
+    
+    An item is repainted when its key or rect changed since the last frame.
+    Repainting first restores the background under the item, so anything
+    overlapping a repainted rect (below or above it) is repainted as well.
+    draw() must stay inside the item's rect.
+    """
+    
+    def __init__(self, screen: pygame.Surface, background_color: Tuple[int, int, int] = (0, 0, 0)):
+        self.screen = screen
+        self.background_color = background_color
+        self.background: Optional[pygame.Surface] = None
+        self._static: Dict[str, Tuple[Any, Callable[[pygame.Surface], None]]] = {}
+        self._static_changed = True
+        self._items: List[Tuple[str, Any, pygame.Rect, Callable[[], None]]] = []
+        self._drawn: Dict[str, Tuple[Any, pygame.Rect]] = {}
+        self._full = True
+    
+    def invalidate(self):
+        """Repaint and push the whole screen on the next compose."""
+        self._full = True
+    
+    def resize(self, screen: pygame.Surface):
+        """Switch to a resized screen; the background is rebuilt at the new size."""
+        self.screen = screen
+        self.background = None
+        self._drawn.clear()
+        self._full = True
+    
+    def static(self, name: str, key: Any, paint: Callable[[pygame.Surface], None]):
+        """Register a background layer; it is (re)painted only when its key changes."""
+        old = self._static.get(name)
+        if old is None or old[0] != key:
+            self._static_changed = True
+        self._static[name] = (key, paint)
+    
+    def add(self, name: str, key: Any, rect, draw: Callable[[], None]):
+        """Queue a dynamic item for this frame."""
+        self._items.append((name, key, pygame.Rect(rect), draw))
+    
+    def _build_background(self):
+        self.background = pygame.Surface(self.screen.get_size())
+        self.background.fill(self.background_color)
+        for _, paint in self._static.values():
+            paint(self.background)
+        self._static_changed = False
+        self._full = True
+    
+    def compose(self) -> List[pygame.Rect]:
+        """Repaint what changed this frame. Returns the screen rects to update."""
+        items, self._items = self._items, []
+        if self.background is None or self._static_changed:
+            self._build_background()
+        screen_rect = self.screen.get_rect()
+        
+        if self._full:
+            self.screen.blit(self.background, (0, 0))
+            for *_, draw in items:
+                draw()
+            dirty = [screen_rect]
+        else:
+            names = {name for name, *_ in items}
+            dirty = [rect for name, (_, rect) in self._drawn.items() if name not in names]
+            redraw = []
+            for name, key, rect, _ in items:
+                old = self._drawn.get(name)
+                changed = old is None or old[0] != key or old[1] != rect
+                redraw.append(changed)
+                if changed:
+                    dirty.append(rect)
+                    if old is not None:
+                        dirty.append(old[1])
+            
+            # Items overlapping a repainted area are repainted too
+            grown = True
+            while grown:
+                grown = False
+                for i, (_, _, rect, _) in enumerate(items):
+                    if not redraw[i] and rect.collidelist(dirty) >= 0:
+                        redraw[i] = True
+                        dirty.append(rect)
+                        grown = True
+            
+            dirty = [rect.clip(screen_rect) for rect in dirty]
+            dirty = [rect for rect in dirty if rect.width and rect.height]
+            for rect in dirty:
+                self.screen.blit(self.background, rect, rect)
+            for (*_, draw), again in zip(items, redraw):
+                if again:
+                    draw()
+        
+        self._drawn = {name: (key, rect) for name, key, rect, _ in items}
+        self._full = False
+        return dirty
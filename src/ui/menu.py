@@ -6,8 +6,12 @@ Simple Pygame-based menu for selecting Year, Grand Prix, and Driver.
 import pygame
 from typing import Tuple, List, Optional
 from ..data.loader import F1DataLoader
+from ..data.load_job import LoadJob, LoadCancelled
 
 class MenuScreen:
+    # Start loading a highlighted Grand Prix once it has stayed highlighted this long
+    PREFETCH_DELAY_MS = 400
+    
     def __init__(self, screen: pygame.Surface, loader: F1DataLoader):
         self.screen = screen
         self.loader = loader
@@ -28,7 +32,37 @@ class MenuScreen:
         rect = surf.get_rect(center=(self.width // 2, y))
         self.screen.blit(surf, rect)
         return rect
+    
+    def wait_for(self, job: LoadJob, message: str):
+        """
+        Keep the menu responsive until a background job finishes.
+        Returns its result, or None if the user pressed ESC or it failed.
+        """
+        clock = pygame.time.Clock()
+        while not job.done():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    exit()
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                    return None
+            
+            self.screen.fill(self.BG_COLOR)
+            title_surf = self.title_font.render("F1 STRATEGY ENGINEER", True, self.HIGHLIGHT_COLOR)
+            self.screen.blit(title_surf, title_surf.get_rect(center=(self.width//2, 80)))
+            self.draw_text_centered(message, self.height // 2, self.TEXT_COLOR)
+            self.draw_text_centered("ESC - Back", self.height - 100, (150, 150, 150))
+            pygame.display.flip()
+            clock.tick(30)
         
+        try:
+            return job.result()
+        except LoadCancelled:
+            return None
+        except Exception as e:
+            print(f"Loading failed: {e}")
+            return None
+    
     def run(self) -> Tuple[int, str, str]:
         """
         Main menu loop. 
@@ -47,10 +81,24 @@ class MenuScreen:
         
         selection_idx = 0
         
+        # Speculative prefetch of the highlighted Grand Prix
+        highlighted = None
+        highlighted_since = 0
+        prefetched = None
+        
         clock = pygame.time.Clock()
         running = True
         
         while running:
+            if step == 1 and races:
+                race = races[selection_idx]
+                now = pygame.time.get_ticks()
+                if race != highlighted:
+                    highlighted, highlighted_since = race, now
+                elif race != prefetched and now - highlighted_since >= self.PREFETCH_DELAY_MS:
+                    self.loader.prefetch_race(selected_year, race, 'R')
+                    prefetched = race
+            
             self.screen.fill(self.BG_COLOR)
             
             # Title
@@ -109,14 +157,14 @@ class MenuScreen:
                             
                         elif step == 1: # Race selected
                             selected_race = current_options[selection_idx]
-                            # Load session just to get driver list? 
-                            # This might take a moment, show loading
-                            self.draw_text_centered("Loading Session Data...", self.height - 100, self.HIGHLIGHT_COLOR)
-                            pygame.display.flip()
-                            
-                            session = self.loader.load_session(selected_year, selected_race, 'R')
-                            raw_drivers = self.loader.get_drivers(session)
-                            drivers = raw_drivers # List of tuples
+                            # Driver list comes from the snapshot or the (possibly
+                            # already prefetched) session, which the race load reuses
+                            year, race = selected_year, selected_race
+                            job = LoadJob(lambda job: self.loader.get_driver_list(year, race, 'R'))
+                            drivers = self.wait_for(job, "Loading Session Data...") # List of tuples
+                            if not drivers:
+                                drivers = []
+                                continue
                             step = 2
                             selection_idx = 0
                             
@@ -0,0 +1,220 @@
+"""
+Frame Profiler
+Optional timing of every frame of the game loop: event handling, the
+simulation update, each GameRenderer draw call, compositing and the display
+update. Keeps the last frames in fixed-size ring buffers for rolling
+percentiles, draws a small overlay graph and dumps a per-frame CSV/JSON trace.
+"""
+
+import csv
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+
+class FrameProfiler:
+    """
+    Frame protocol:
+        profiler.begin_frame()
+        profiler.mark("events")       # time since the previous mark
+        ...                           # instrumented methods time themselves
+        profiler.end_frame()
+    
+    instrument(obj, names) times methods of an object by shadowing them with
+    timing wrappers, only while the profiler is enabled. Disabled, the
+    wrappers are removed and each mark is a single flag check.
+    """
+    
+    HISTORY = 600                  # Frames kept (10 s at 60 fps)
+    PERCENTILES = (50, 95, 99)
+    REFRESH_FRAMES = 30            # Overlay statistics are recomputed this often
+    GRAPH_FRAMES = 120
+    GRAPH_MS = 33.3                # Full height of the overlay graph
+    BUDGET_MS = 1000 / 60
+    
+    ENV_VAR = "F1_PROFILE"         # Set to 1 to start with the profiler on
+    TRACE_ENV_VAR = "F1_PROFILE_TRACE"  # Trace file (.csv or .json) written on exit
+    
+    def __init__(self, enabled: bool = False, history: int = HISTORY):
+        self.history = history
+        self.enabled = False
+        self._totals = np.zeros(history)
+        self._sections: Dict[str, np.ndarray] = {}
+        self._frames = 0
+        self._current: Dict[str, float] = {}
+        self._frame_start = 0.0
+        self._last = 0.0
+        self._targets: List[Tuple[object, Sequence[str]]] = []
+        self._stats: List[Tuple[str, np.ndarray]] = []
+        self._rows: Optional[List[List[pygame.Surface]]] = None  # Rendered statistics
+        self.set_enabled(enabled)
+    
+    @classmethod
+    def from_env(cls) -> 'FrameProfiler':
+        return cls(enabled=os.environ.get(cls.ENV_VAR, "") not in ("", "0"))
+    
+    # === Instrumentation ===
+    
+    def instrument(self, obj: object, names: Sequence[str]):
+        """Time the given methods of obj under their own names."""
+        self._targets.append((obj, list(names)))
+        if self.enabled:
+            self._wrap(obj, names)
+    
+    def _wrap(self, obj: object, names: Sequence[str]):
+        for name in names:
+            setattr(obj, name, self._timed(name, getattr(type(obj), name).__get__(obj)))
+    
+    @staticmethod
+    def _unwrap(obj: object, names: Sequence[str]):
+        for name in names:
+            obj.__dict__.pop(name, None)
+    
+    def _timed(self, name: str, method):
+        current = self._current
+        
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._last = end = time.perf_counter()
+                current[name] = current.get(name, 0.0) + end - start
+        return timed
+    
+    def set_enabled(self, enabled: bool):
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        for obj, names in self._targets:
+            if enabled:
+                self._wrap(obj, names)
+            else:
+                self._unwrap(obj, names)
+        self._current.clear()
+        # Marks before the next begin_frame only time from here
+        self._frame_start = 0.0
+        self._last = time.perf_counter()
+    
+    def toggle(self) -> bool:
+        self.set_enabled(not self.enabled)
+        return self.enabled
+    
+    # === Per-frame timing ===
+    
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self._current.clear()
+        self._frame_start = self._last = time.perf_counter()
+    
+    def mark(self, name: str):
+        """Charge the time since the previous mark (or timed call) to `name`."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._current[name] = self._current.get(name, 0.0) + now - self._last
+        self._last = now
+    
+    def end_frame(self):
+        if not self.enabled or not self._frame_start:
+            return
+        i = self._frames % self.history
+        self._totals[i] = time.perf_counter() - self._frame_start
+        for ring in self._sections.values():
+            ring[i] = 0.0
+        for name, seconds in self._current.items():
+            ring = self._sections.get(name)
+            if ring is None:
+                ring = self._sections[name] = np.zeros(self.history)
+            ring[i] = seconds
+        self._frames += 1
+        if self._frames % self.REFRESH_FRAMES == 0:
+            self._stats = list(self.percentiles().items())
+            self._rows = None
+    
+    # === Results ===
+    
+    def _order(self) -> np.ndarray:
+        """Ring indices of the recorded frames, oldest first."""
+        n = min(self._frames, self.history)
+        return (np.arange(self._frames - n, self._frames)) % self.history
+    
+    def percentiles(self) -> Dict[str, np.ndarray]:
+        """Milliseconds at PERCENTILES for the whole frame and each section."""
+        order = self._order()
+        if len(order) == 0:
+            return {}
+        stats = {"frame": np.percentile(self._totals[order], self.PERCENTILES) * 1000}
+        for name, ring in self._sections.items():
+            stats[name] = np.percentile(ring[order], self.PERCENTILES) * 1000
+        return stats
+    
+    def trace(self) -> List[Dict[str, float]]:
+        """One record per recorded frame, oldest first, times in milliseconds."""
+        first = self._frames - len(self._order())
+        return [
+            {
+                "frame": first + n,
+                "total_ms": round(self._totals[i] * 1000, 4),
+                **{name: round(ring[i] * 1000, 4) for name, ring in self._sections.items()}
+            }
+            for n, i in enumerate(self._order().tolist())
+        ]
+    
+    def dump(self, path: Path) -> Path:
+        """Write the trace as CSV, or JSON when the path ends in .json."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        records = self.trace()
+        if path.suffix == ".json":
+            path.write_text(json.dumps({"percentiles": self.PERCENTILES, "frames": records}, indent=1))
+        else:
+            fields = ["frame", "total_ms", *self._sections]
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(records)
+        return path
+    
+    # === Overlay ===
+    
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font, pos: Tuple[int, int] = (20, 90)) -> pygame.Rect:
+        """Draw the frame time graph and section percentiles. Returns the area drawn."""
+        x, y = pos
+        row_h = font.get_linesize()
+        graph_h = 50
+        width = 300
+        rect = pygame.Rect(x, y, width, graph_h + 16 + row_h * (len(self._stats) + 1))
+        pygame.draw.rect(surface, (10, 10, 10), rect)
+        pygame.draw.rect(surface, (90, 90, 90), rect, 1)
+        
+        # Frame times, newest on the right; the line is the 60 fps budget
+        order = self._order()[-self.GRAPH_FRAMES:]
+        heights = np.minimum(self._totals[order] * 1000 / self.GRAPH_MS, 1.0) * graph_h
+        bottom = y + 4 + graph_h
+        bar_w = (width - 8) / self.GRAPH_FRAMES
+        for n, (h, ms) in enumerate(zip(heights.tolist(), (self._totals[order] * 1000).tolist())):
+            bx = x + 4 + int(n * bar_w)
+            color = (0, 200, 120) if ms <= self.BUDGET_MS else (255, 90, 60)
+            pygame.draw.line(surface, color, (bx, bottom), (bx, bottom - int(h)))
+        budget_y = bottom - int(self.BUDGET_MS / self.GRAPH_MS * graph_h)
+        pygame.draw.line(surface, (200, 200, 0), (x + 4, budget_y), (x + width - 4, budget_y))
+        
+        if self._rows is None:
+            header = [font.render(text, True, (150, 150, 150)) for text in ("ms", *(f"p{q}" for q in self.PERCENTILES))]
+            self._rows = [header] + [
+                [font.render(text, True, (230, 230, 230)) for text in (name[:24], *(f"{v:.2f}" for v in values.tolist()))]
+                for name, values in self._stats
+            ]
+        for n, row in enumerate(self._rows):
+            text_y = bottom + 6 + n * row_h
+            surface.blit(row[0], (x + 6, text_y))
+            for col, text in enumerate(row[1:], 1):
+                surface.blit(text, (x + 130 + col * 50 - text.get_width(), text_y))
+        return rect
@@ -2,13 +2,20 @@
 Game Renderer
 Handles all Pygame drawing: Track, Cars (all drivers), HUD, and Controls.
 Features separate visual styles for ghost vs player and pit stop offsets.
+
+Drawing is layered: the draw_* calls of a frame register static layers and
+dynamic items with a LayeredScreen, and compose() repaints only what changed.
 """
 
+from functools import partial
+
 import pygame
 import numpy as np
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Optional
 from ..data.mapper import CoordinateMapper
 from ..core.sim_engine import CarState
+from .layers import LayeredScreen
+from .surface_cache import SurfaceCache
 
 class GameRenderer:
     # Color Palette
@@ -26,6 +33,13 @@ class GameRenderer:
     COLOR_BTN_ACTIVE = (0, 80, 160)
     COLOR_BTN_PENDING = (255, 165, 0)  # Orange for pending pit
     
+    # Bounded caches of rendered text and sprites
+    GLYPH_CACHE_SIZE = 512
+    SPRITE_CACHE_SIZE = 128
+    
+    # Quiet time after the last resize event before re-laying out (window drag)
+    RESIZE_DEBOUNCE_MS = 150
+    
     def __init__(self, screen: pygame.Surface, mapper: CoordinateMapper):
         self.screen = screen
         self.mapper = mapper
@@ -35,31 +49,80 @@ class GameRenderer:
         self.font_large = pygame.font.SysFont("Consolas", 24, bold=True)
         self.font_small = pygame.font.SysFont("Consolas", 16)
         self.font_tiny = pygame.font.SysFont("Consolas", 11)
+        self.font_weather = pygame.font.SysFont("Arial", 20)
         
-        # Pre-render track surface
+        # Pre-render track surface (for one mapper transform version)
         self.track_surface = None
+        self._track_version = -1
+        
+        # Static background layers + dirty-rect repainting of everything else
+        self.layers = LayeredScreen(screen, self.COLOR_BG)
+        
+        # Rendered text by (font, text, color); car sprites and backdrops
+        self.glyphs = SurfaceCache(self.GLYPH_CACHE_SIZE)
+        self.sprites = SurfaceCache(self.SPRITE_CACHE_SIZE)
         
+        # Window size waiting for the resize debounce, and when it is due
+        self._pending_size: Optional[Tuple[int, int]] = None
+        self._resize_due = 0
+        
+        self._layout()
+    
+    def _layout(self):
+        """Size-dependent layout."""
         # Interactive Button Rects
         self.btn_push = pygame.Rect(self.width - 320, self.height - 80, 100, 50)
         self.btn_normal = pygame.Rect(self.width - 210, self.height - 80, 100, 50)
         self.btn_conserve = pygame.Rect(self.width - 100, self.height - 80, 100, 50)
         self.btn_box = pygame.Rect(self.width - 150, self.height - 150, 120, 50)
-        
+    
+    def request_resize(self, size: Tuple[int, int]):
+        """
+        Note a window resize. The layout follows once no resize event has
+        arrived for RESIZE_DEBOUNCE_MS (see resize_due); until then the
+        current layout keeps being repainted in full.
+        """
+        self._pending_size = tuple(size)
+        self._resize_due = pygame.time.get_ticks() + self.RESIZE_DEBOUNCE_MS
+        self.layers.invalidate()
+    
+    def resize_due(self) -> Optional[Tuple[int, int]]:
+        """The new window size once the resize debounce has expired, else None."""
+        if self._pending_size is None or pygame.time.get_ticks() < self._resize_due:
+            return None
+        size, self._pending_size = self._pending_size, None
+        return size
+    
+    def resize(self, screen: pygame.Surface):
+        """
+        Move to a resized display surface. The mapper is re-fitted and only
+        size-dependent state is rebuilt (layout, background, track surface);
+        fonts and the glyph and sprite caches are kept.
+        """
+        self.screen = screen
+        self.width = screen.get_width()
+        self.height = screen.get_height()
+        self.mapper.resize(self.width, self.height)
+        self.layers.resize(screen)
+        self._layout()
+    
     def draw_track(self, track_coords: np.ndarray):
         """
         Draw the track layout.
-        Uses cached surface to avoid transforming points every frame.
+        Uses cached surface to avoid transforming points every frame; it is
+        redrawn when the mapper's transform changes.
         """
-        if self.track_surface is None:
+        # Transform points (cached by the mapper)
+        pixels = self.mapper.fit_to_screen(track_coords)
+        
+        if self.track_surface is None or self._track_version != self.mapper.version:
+            self._track_version = self.mapper.version
             self.track_surface = pygame.Surface((self.width, self.height))
             self.track_surface.fill(self.COLOR_BG)
             
-            # Transform points
-            pixels = self.mapper.fit_to_screen(track_coords)
-            
             if len(pixels) > 1:
-                # Convert to list of tuples for pygame
-                point_list = [(int(p[0]), int(p[1])) for p in pixels]
+                # Convert to list of points for pygame
+                point_list = pixels.astype(np.int64).tolist()
                 
                 # Draw border (closed loop)
                 pygame.draw.lines(self.track_surface, self.COLOR_TRACK_BORDER, True, point_list, 14)
@@ -75,9 +138,20 @@ class GameRenderer:
                 pit_point = point_list[pit_idx]
                 pygame.draw.circle(self.track_surface, (255, 165, 0), pit_point, 6)  # Orange
         
-        # Blit cached background
-        self.screen.blit(self.track_surface, (0, 0))
-
+        # Cached track is the bottom layer of the background
+        self.layers.static('track', self.track_surface, lambda bg: bg.blit(self.track_surface, (0, 0)))
+    
+    def _text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Anti-aliased text, rasterized once per (font, text, color)."""
+        return self.glyphs.get((font, text, color), lambda: font.render(text, True, color))
+    
+    def compose(self) -> List[pygame.Rect]:
+        """
+        Repaint the regions that changed since the last frame.
+        Returns the rects to pass to pygame.display.update.
+        """
+        return self.layers.compose()
+    
     def draw_all_cars(self, all_cars: Dict[str, CarState], player_driver: str):
         """
         Draw ALL cars on track. Player car is highlighted differently.
@@ -91,64 +165,100 @@ class GameRenderer:
         # Draw non-players first, then player on top
         cars_to_draw.sort(key=lambda x: x[1])
         
-        for car, is_player in cars_to_draw:
-            self._draw_car(car, is_player)
+        # One transform for every car on track
+        xs = np.fromiter((car.track_x for car, _ in cars_to_draw), dtype=np.float64, count=len(cars_to_draw))
+        ys = np.fromiter((car.track_y for car, _ in cars_to_draw), dtype=np.float64, count=len(cars_to_draw))
+        pixels = self.mapper.geo_to_pixel_many(xs, ys).tolist()
+        
+        for (car, is_player), pixel in zip(cars_to_draw, pixels):
+            self._draw_car(car, is_player, tuple(pixel))
     
-    def _draw_car(self, car: CarState, is_player: bool):
-        """Draw a single car on the track."""
-        pixel = self.mapper.geo_to_pixel(car.track_x, car.track_y)
+    def _draw_car(self, car: CarState, is_player: bool, pixel: Tuple[int, int]):
+        """Queue a single car on the track at its screen pixel."""
+        original_pixel = None
         
         # Apply Pit Stop Offset for cars in pit
         if car.in_pit:
             offset = self.mapper.get_pit_lane_offset()
             original_pixel = pixel
             pixel = (pixel[0] + offset[0], pixel[1] + offset[1])
+        
+        x, y = pixel
+        
+        # Everything the car draws: glow or circle, label and PIT tag
+        if is_player:
+            label_w, label_h = self.font_small.size(car.driver_code)
+            rect = pygame.Rect(x - 28, y - 28, 56, 56).union((x + 16, y - 10, label_w + 6, label_h + 2))
+            if car.pit_requested:
+                rect.union_ip(pygame.Rect((x + 16, y + 5), self.font_tiny.size("PIT")))
+        else:
+            label_w, label_h = self.font_tiny.size(car.driver_code)
+            rect = pygame.Rect(x - 9, y - 9, 18, 18).union((x + 10, y - 5, label_w, label_h))
+        if original_pixel:
+            rect.union_ip(pygame.Rect(original_pixel, (1, 1)))
+        
+        key = (pixel, original_pixel, car.pit_requested, car.team_color)
+        draw = partial(self._paint_car, car.driver_code, car.team_color, is_player, pixel, original_pixel, car.pit_requested)
+        self.layers.add(f"car:{car.driver_code}", key, rect, draw)
+    
+    def _paint_car(self, driver_code: str, color: tuple, is_player: bool, pixel: Tuple[int, int],
+                   original_pixel: Optional[Tuple[int, int]], pit_requested: bool):
+        """Draw a single car on the track."""
+        if original_pixel:
             # Draw connector line
             pygame.draw.line(self.screen, (80, 80, 80), original_pixel, pixel, 1)
         
         x, y = pixel
         
+        sprite = self.sprites.get(('car', color, is_player), partial(self._make_car_sprite, color, is_player))
+        half = sprite.get_width() // 2
+        self.screen.blit(sprite, (x - half, y - half))
+        
         if is_player:
-            # Player car: Larger, solid, with label
-            radius = 14
-            color = car.team_color
-            
-            # Outer glow effect
-            glow_surf = pygame.Surface((radius*4, radius*4), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (*color, 60), (radius*2, radius*2), radius + 6)
-            self.screen.blit(glow_surf, (x - radius*2, y - radius*2))
-            
-            # Main circle
-            pygame.draw.circle(self.screen, color, (x, y), radius)
-            pygame.draw.circle(self.screen, (255, 255, 255), (x, y), radius, 3)
-            
             # Label
-            label = car.driver_code
-            text = self.font_small.render(label, True, (255, 255, 255))
-            text_bg = pygame.Surface((text.get_width() + 6, text.get_height() + 2), pygame.SRCALPHA)
-            text_bg.fill((0, 0, 0, 180))
+            label = driver_code
+            text = self._text(self.font_small, label, (255, 255, 255))
+            size = (text.get_width() + 6, text.get_height() + 2)
+            text_bg = self.sprites.get(('backdrop', size, 180), partial(self._make_backdrop, size, 180))
             self.screen.blit(text_bg, (x + 16, y - 10))
             self.screen.blit(text, (x + 19, y - 9))
             
             # Pit request indicator
-            if car.pit_requested:
-                pit_text = self.font_tiny.render("PIT", True, (255, 165, 0))
+            if pit_requested:
+                pit_text = self._text(self.font_tiny, "PIT", (255, 165, 0))
                 self.screen.blit(pit_text, (x + 16, y + 5))
+        else:
+            # Small driver code
+            label = self._text(self.font_tiny, driver_code, (200, 200, 200))
+            self.screen.blit(label, (x + 10, y - 5))
+    
+    @staticmethod
+    def _make_car_sprite(color: tuple, is_player: bool) -> pygame.Surface:
+        """A car's circle, drawn once per team color and style."""
+        if is_player:
+            # Player car: Larger, solid, with an outer glow
+            radius = 14
+            surf = pygame.Surface((radius*4, radius*4), pygame.SRCALPHA)
+            center = (radius*2, radius*2)
+            pygame.draw.circle(surf, (*color, 60), center, radius + 6)
+            pygame.draw.circle(surf, color, center, radius)
+            pygame.draw.circle(surf, (255, 255, 255), center, radius, 3)
         else:
             # Other cars: Smaller, semi-transparent
             radius = 8
-            color = car.team_color
-            
-            # Semi-transparent circle
             surf = pygame.Surface((radius*2 + 2, radius*2 + 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*color, 180), (radius + 1, radius + 1), radius)
-            pygame.draw.circle(surf, (255, 255, 255, 100), (radius + 1, radius + 1), radius, 1)
-            self.screen.blit(surf, (x - radius - 1, y - radius - 1))
-            
-            # Small driver code
-            label = self.font_tiny.render(car.driver_code, True, (200, 200, 200))
-            self.screen.blit(label, (x + 10, y - 5))
-
+            center = (radius + 1, radius + 1)
+            pygame.draw.circle(surf, (*color, 180), center, radius)
+            pygame.draw.circle(surf, (255, 255, 255, 100), center, radius, 1)
+        return surf
+    
+    @staticmethod
+    def _make_backdrop(size: Tuple[int, int], alpha: int) -> pygame.Surface:
+        """Translucent black rectangle."""
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill((0, 0, 0, alpha))
+        return surf
+    
     def draw_dashboard(self, state: CarState, laps_total: int, current_weather_rain: float, 
                        player_position: int, total_cars: int, comparison: dict = None):
         """
@@ -158,20 +268,22 @@ class GameRenderer:
         panel_w, panel_h = 320, 260
         panel_x, panel_y = 20, self.height - 280
         
-        surf = pygame.Surface((panel_w, panel_h))
-        surf.set_alpha(200)
-        surf.fill((0, 0, 0))
-        self.screen.blit(surf, (panel_x, panel_y))
+        def paint_panel(bg: pygame.Surface):
+            surf = pygame.Surface((panel_w, panel_h))
+            surf.set_alpha(200)
+            surf.fill((0, 0, 0))
+            bg.blit(surf, (panel_x, panel_y))
+            
+            # Draw Border
+            pygame.draw.rect(bg, self.COLOR_TEXT, (panel_x, panel_y, panel_w, panel_h), 2)
         
-        # Draw Border
-        pygame.draw.rect(self.screen, self.COLOR_TEXT, (panel_x, panel_y, panel_w, panel_h), 2)
+        self.layers.static('dashboard', (panel_x, panel_y), paint_panel)
         
         # Position badge
         pos_color = (255, 215, 0) if player_position == 1 else (192, 192, 192) if player_position == 2 else (205, 127, 50) if player_position == 3 else (255, 255, 255)
-        pos_text = self.font_large.render(f"P{player_position}", True, pos_color)
-        self.screen.blit(pos_text, (panel_x + 20, panel_y + 15))
         
         # Historical comparison (if available)
+        delta_text, delta_color = None, None
         if comparison:
             delta = comparison.get('position_delta', 0)
             if delta > 0:
@@ -183,9 +295,6 @@ class GameRenderer:
             else:
                 delta_text = "= REAL"
                 delta_color = (255, 255, 255)
-            
-            cmp_surf = self.font_small.render(delta_text, True, delta_color)
-            self.screen.blit(cmp_surf, (panel_x + 80, panel_y + 18))
         
         # Pit status
         pit_status = ""
@@ -205,10 +314,10 @@ class GameRenderer:
             pit_status
         ]
         
+        rows = []
         for i, line in enumerate(lines):
             if not line:
                 continue
-            font = self.font_small
             color = self.COLOR_TEXT
             
             # Color code wear
@@ -219,9 +328,22 @@ class GameRenderer:
             # Color pit status
             if "PIT" in line:
                 color = (255, 165, 0)
-                
-            tsurf = font.render(line, True, color)
-            self.screen.blit(tsurf, (panel_x + 20, panel_y + 50 + i*25))
+            rows.append((i, line, color))
+        
+        def paint():
+            pos_text = self._text(self.font_large, f"P{player_position}", pos_color)
+            self.screen.blit(pos_text, (panel_x + 20, panel_y + 15))
+            
+            if delta_text:
+                cmp_surf = self._text(self.font_small, delta_text, delta_color)
+                self.screen.blit(cmp_surf, (panel_x + 80, panel_y + 18))
+            
+            for i, line, color in rows:
+                tsurf = self._text(self.font_small, line, color)
+                self.screen.blit(tsurf, (panel_x + 20, panel_y + 50 + i*25))
+        
+        key = (player_position, delta_text, tuple(rows))
+        self.layers.add('dashboard', key, (panel_x + 2, panel_y + 2, panel_w - 4, panel_h - 4), paint)
     
     def draw_leaderboard(self, sorted_cars: List[CarState], player_driver: str):
         """
@@ -230,48 +352,70 @@ class GameRenderer:
         panel_w, panel_h = 180, min(220, 30 + len(sorted_cars) * 18)
         panel_x, panel_y = self.width - panel_w - 20, 20
         
-        surf = pygame.Surface((panel_w, panel_h))
-        surf.set_alpha(180)
-        surf.fill((0, 0, 0))
-        self.screen.blit(surf, (panel_x, panel_y))
-        pygame.draw.rect(self.screen, (100, 100, 100), (panel_x, panel_y, panel_w, panel_h), 1)
+        def paint_panel(bg: pygame.Surface):
+            surf = pygame.Surface((panel_w, panel_h))
+            surf.set_alpha(180)
+            surf.fill((0, 0, 0))
+            bg.blit(surf, (panel_x, panel_y))
+            pygame.draw.rect(bg, (100, 100, 100), (panel_x, panel_y, panel_w, panel_h), 1)
+            
+            # Title
+            title = self._text(self.font_small, "STANDINGS", self.COLOR_TEXT)
+            bg.blit(title, (panel_x + 10, panel_y + 5))
         
-        # Title
-        title = self.font_small.render("STANDINGS", True, self.COLOR_TEXT)
-        self.screen.blit(title, (panel_x + 10, panel_y + 5))
+        self.layers.static('leaderboard', (panel_x, panel_w, panel_h), paint_panel)
         
         # Show top 10 + player if not in top 10
         top_n = sorted_cars[:10]
-        player_shown = False
+        rows = []
         
         for i, car in enumerate(top_n):
             is_player = (car.driver_code == player_driver)
-            if is_player:
-                player_shown = True
-            
-            y_pos = panel_y + 28 + i * 18
-            
-            # Position number
-            pos_text = self.font_tiny.render(f"{i+1}.", True, (150, 150, 150))
-            self.screen.blit(pos_text, (panel_x + 10, y_pos))
             
             # Driver code with team color
             color = car.team_color if not is_player else (255, 255, 255)
-            bg_color = (50, 50, 50) if is_player else None
-            
-            if bg_color:
-                pygame.draw.rect(self.screen, bg_color, (panel_x + 30, y_pos - 1, 50, 16))
             
-            drv_text = self.font_tiny.render(car.driver_code, True, color)
-            self.screen.blit(drv_text, (panel_x + 35, y_pos))
-            
-            # Lap and gap info
-            if car.gap_to_leader > 0:
-                gap_text = self.font_tiny.render(f"+{car.gap_to_leader:.1f}s", True, (120, 120, 120))
+            # Lap for the leader; live gap and interval for everyone else
+            if i == 0:
+                gap_label, interval_label = f"L{car.current_lap}", ""
+            elif car.laps_down > 0:
+                gap_label = f"+{car.laps_down} LAP"
+                interval_label = f"+{car.interval:.1f}"
             else:
-                gap_text = self.font_tiny.render(f"L{car.current_lap}", True, (120, 120, 120))
-            self.screen.blit(gap_text, (panel_x + 90, y_pos))
-            
+                gap_label = f"+{car.gap_to_leader:.1f}s"
+                interval_label = f"+{car.interval:.1f}"
+            rows.append((car.driver_code, color, is_player, gap_label, interval_label))
+        
+        # Gap and interval columns are right-aligned and clipped inside the panel
+        rect = pygame.Rect(panel_x + 1, panel_y + 26, panel_w - 2, panel_h - 27)
+        gap_right = panel_x + 130
+        interval_right = panel_x + panel_w - 8
+        
+        def paint():
+            clip = self.screen.get_clip()
+            self.screen.set_clip(rect)
+            for i, (driver_code, color, is_player, gap_label, interval_label) in enumerate(rows):
+                y_pos = panel_y + 28 + i * 18
+                
+                # Position number
+                pos_text = self._text(self.font_tiny, f"{i+1}.", (150, 150, 150))
+                self.screen.blit(pos_text, (panel_x + 10, y_pos))
+                
+                if is_player:
+                    pygame.draw.rect(self.screen, (50, 50, 50), (panel_x + 30, y_pos - 1, 50, 16))
+                
+                drv_text = self._text(self.font_tiny, driver_code, color)
+                self.screen.blit(drv_text, (panel_x + 35, y_pos))
+                
+                gap_text = self._text(self.font_tiny, gap_label, (120, 120, 120))
+                self.screen.blit(gap_text, gap_text.get_rect(topright=(gap_right, y_pos)))
+                if interval_label:
+                    interval_text = self._text(self.font_tiny, interval_label, (90, 90, 90))
+                    self.screen.blit(interval_text, interval_text.get_rect(topright=(interval_right, y_pos)))
+            self.screen.set_clip(clip)
+        
+        self.layers.add('leaderboard', tuple(rows), rect, paint)
+    
     def draw_controls(self, current_mode: str, pit_requested: bool = False):
         """
         Draw interactive buttons.
@@ -298,24 +442,40 @@ class GameRenderer:
             else:
                 color = self.COLOR_BTN_NORMAL
             
-            pygame.draw.rect(self.screen, color, rect, border_radius=5)
-            pygame.draw.rect(self.screen, (255, 255, 255), rect, 2, border_radius=5)
-            
-            text = self.font_small.render(label, True, self.COLOR_TEXT)
-            text_rect = text.get_rect(center=rect.center)
-            self.screen.blit(text, text_rect)
+            self.layers.add(f"control:{mode_id}", (label, color), rect, partial(self._paint_button, rect, label, color, 2))
+    
+    def _paint_button(self, rect: pygame.Rect, label: str, color: tuple, border: int):
+        pygame.draw.rect(self.screen, color, rect, border_radius=5)
+        pygame.draw.rect(self.screen, (255, 255, 255), rect, border, border_radius=5)
+        
+        text = self._text(self.font_small, label, self.COLOR_TEXT)
+        text_rect = text.get_rect(center=rect.center)
+        self.screen.blit(text, text_rect)
+    
+    def draw_time_scale(self, time_scale: float, reverse: bool = False):
+        """Draw the playback speed when not real time, below the sandbox weather indicator."""
+        if time_scale == 1 and not reverse:
+            return
+        label = f"SPEED {'-' if reverse else ''}{time_scale:g}x"
+        color = (255, 160, 0) if reverse else (0, 200, 255)
+        rect = pygame.Rect((20, 50 + self.font_weather.get_linesize()), self.font_small.size(label))
+        self.layers.add('time_scale', (label, color), rect,
+                        lambda: self.screen.blit(self._text(self.font_small, label, color), rect))
     
     def draw_pause_overlay(self):
         """Draw pause screen overlay."""
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
+        self.layers.add('pause', None, self.screen.get_rect(), self._paint_pause_overlay)
+    
+    def _paint_pause_overlay(self):
+        size = (self.width, self.height)
+        overlay = self.sprites.get(('backdrop', size, 150), partial(self._make_backdrop, size, 150))
         self.screen.blit(overlay, (0, 0))
         
-        pause_text = self.font_large.render("PAUSED", True, (255, 255, 255))
+        pause_text = self._text(self.font_large, "PAUSED", (255, 255, 255))
         text_rect = pause_text.get_rect(center=(self.width // 2, self.height // 2 - 20))
         self.screen.blit(pause_text, text_rect)
         
-        hint_text = self.font_small.render("Press SPACE to resume | ESC to quit", True, (180, 180, 180))
+        hint_text = self._text(self.font_small, "Press SPACE to resume | ESC to quit", (180, 180, 180))
         hint_rect = hint_text.get_rect(center=(self.width // 2, self.height // 2 + 20))
         self.screen.blit(hint_text, hint_rect)
     
@@ -331,43 +491,51 @@ class GameRenderer:
         bar_width = self.width - bar_x - 200  # Leave space on right for buttons
         bar_y = 10
         
-        # Background
-        pygame.draw.rect(self.screen, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height), border_radius=5)
-        pygame.draw.rect(self.screen, (80, 80, 80), (bar_x, bar_y, bar_width, bar_height), 2, border_radius=5)
-        
-        # Progress fill
+        def paint_bar(bg: pygame.Surface):
+            # Background
+            pygame.draw.rect(bg, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height), border_radius=5)
+            pygame.draw.rect(bg, (80, 80, 80), (bar_x, bar_y, bar_width, bar_height), 2, border_radius=5)
+            
+            # Lap markers
+            for lap in range(1, total_laps + 1):
+                lap_x = bar_x + int((lap / total_laps) * bar_width)
+                if lap % 10 == 0:  # Major markers every 10 laps
+                    pygame.draw.line(bg, (150, 150, 150), (lap_x, bar_y), (lap_x, bar_y + bar_height), 2)
+                    lap_text = self._text(self.font_tiny, str(lap), (150, 150, 150))
+                    bg.blit(lap_text, (lap_x - 8, bar_y + bar_height + 2))
+                elif lap % 5 == 0:  # Minor markers every 5 laps
+                    pygame.draw.line(bg, (80, 80, 80), (lap_x, bar_y + 5), (lap_x, bar_y + bar_height - 5), 1)
+        
+        self.layers.static('timeline', (bar_width, total_laps), paint_bar)
+        
+        # Progress fill and current position indicator
         fill_width = int(bar_width * progress)
-        if fill_width > 0:
-            pygame.draw.rect(self.screen, (0, 150, 255), (bar_x + 2, bar_y + 2, fill_width - 4, bar_height - 4), border_radius=3)
-        
-        # Lap markers
-        for lap in range(1, total_laps + 1):
-            lap_x = bar_x + int((lap / total_laps) * bar_width)
-            if lap % 10 == 0:  # Major markers every 10 laps
-                pygame.draw.line(self.screen, (150, 150, 150), (lap_x, bar_y), (lap_x, bar_y + bar_height), 2)
-                lap_text = self.font_tiny.render(str(lap), True, (150, 150, 150))
-                self.screen.blit(lap_text, (lap_x - 8, bar_y + bar_height + 2))
-            elif lap % 5 == 0:  # Minor markers every 5 laps
-                pygame.draw.line(self.screen, (80, 80, 80), (lap_x, bar_y + 5), (lap_x, bar_y + bar_height - 5), 1)
-        
-        # Current position indicator
         pos_x = bar_x + int(progress * bar_width)
-        pygame.draw.polygon(self.screen, (255, 255, 255), [
-            (pos_x, bar_y + bar_height),
-            (pos_x - 6, bar_y + bar_height + 8),
-            (pos_x + 6, bar_y + bar_height + 8)
-        ])
+        
+        def paint_progress():
+            if fill_width > 0:
+                pygame.draw.rect(self.screen, (0, 150, 255), (bar_x + 2, bar_y + 2, fill_width - 4, bar_height - 4), border_radius=3)
+            pygame.draw.polygon(self.screen, (255, 255, 255), [
+                (pos_x, bar_y + bar_height),
+                (pos_x - 6, bar_y + bar_height + 8),
+                (pos_x + 6, bar_y + bar_height + 8)
+            ])
+        
+        # Fill is drawn over the lap markers, so those are repainted with it
+        rect = (bar_x - 6, bar_y, bar_width + 13, bar_height + 9)
+        self.layers.add('timeline', (fill_width, pos_x), rect, paint_progress)
         
         # Lap counter on the left
         lap_label = f"LAP {current_lap}/{total_laps}"
-        lap_text = self.font_large.render(lap_label, True, self.COLOR_TEXT)
-        self.screen.blit(lap_text, (20, bar_y + 3))
+        lap_rect = pygame.Rect((20, bar_y + 3), self.font_large.size(lap_label))
+        self.layers.add('lap_counter', lap_label, lap_rect,
+                        lambda: self.screen.blit(self._text(self.font_large, lap_label, self.COLOR_TEXT), lap_rect))
         
         # Store timeline rect for click handling
         self.timeline_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
         self.timeline_bar_x = bar_x
         self.timeline_bar_width = bar_width
-        
+    
     def draw_lap_controls(self, current_lap: int, total_laps: int):
         """
         Draw lap jump buttons (<<, <, >, >>).
@@ -394,13 +562,15 @@ class GameRenderer:
             is_hover = rect.collidepoint(mouse_pos)
             color = self.COLOR_BTN_HOVER if is_hover else self.COLOR_BTN_NORMAL
             
-            pygame.draw.rect(self.screen, color, rect, border_radius=5)
-            pygame.draw.rect(self.screen, (255, 255, 255), rect, 1, border_radius=5)
-            
-            text = self.font_small.render(label, True, self.COLOR_TEXT)
-            text_rect = text.get_rect(center=rect.center)
-            self.screen.blit(text, text_rect)
-            
+            self.layers.add(f"lap_control:{label}", color, rect, partial(self._paint_button, rect, label, color, 1))
+    
+    def draw_sandbox_weather(self, intensity: float):
+        """Draw the sandbox weather indicator under the lap counter."""
+        label = f"SANDBOX WEATHER: {intensity:.0%}"
+        rect = pygame.Rect((20, 50), self.font_weather.size(label))
+        self.layers.add('sandbox_weather', label, rect,
+                        lambda: self.screen.blit(self._text(self.font_weather, label, (0, 255, 255)), rect))
+    
     def handle_input(self, event, engine):
         """
         Handle UI clicks to control engine.
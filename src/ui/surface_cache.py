@@ -0,0 +1,44 @@
+"""
+Surface Cache
+Bounded LRU cache of rendered pygame surfaces (text glyph runs, car sprites,
+translucent backdrops) so steady-state frames do not allocate or rasterize.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pygame
+
+
+class SurfaceCache:
+    """
+    Surfaces keyed by whatever determines their pixels, e.g.
+    (font, text, color) or (team color, is_player).
+    The least recently used surface is dropped once max_size is reached.
+    """
+    
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._surfaces: 'OrderedDict[Hashable, pygame.Surface]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, make: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Cached surface for key, created with make() on a miss."""
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = self._surfaces[key] = make()
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        self._surfaces.clear()
+    
+    def __len__(self) -> int:
+        return len(self._surfaces)